@@ -10,6 +10,7 @@ from ops.core.paths import (
   FRONTEND_DIR,
   PROTO_MARKER,
   PROTOS_DIR,
+  PYTHON_PACKAGES,
   REPO_ROOT,
   TS_PROTOS_DIR,
 )
@@ -145,14 +146,7 @@ def build_packages(force: bool = False, verbose: bool = False) -> bool:
   bundle_frontend(verbose=verbose)
 
   # Build all Python packages
-  packages = [
-    "adk-sim-protos",
-    "adk-sim-testing",
-    "adk-sim-server",
-    "adk-agent-sim",
-  ]
-
-  for pkg in packages:
+  for pkg in PYTHON_PACKAGES:
     run(
       ["uv", "build", "--package", pkg],
       cwd=REPO_ROOT,
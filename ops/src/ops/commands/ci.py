@@ -11,7 +11,6 @@ import re
 import subprocess
 import tempfile
 import time
-import urllib.request
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -28,7 +27,7 @@ from ops.commands.test import (
 )
 from ops.core.console import console
 from ops.core.git import get_changed_files, get_upstream_branch
-from ops.core.paths import REPO_ROOT
+from ops.core.paths import PYTHON_PACKAGES, REPO_ROOT
 from ops.core.process import require_tools, run
 
 if TYPE_CHECKING:
@@ -399,14 +398,7 @@ def build_cmd(
   console.print("\n[bold]Building Python packages...[/bold]")
   output_dir.mkdir(parents=True, exist_ok=True)
 
-  packages = [
-    "adk-sim-protos",
-    "adk-sim-testing",
-    "adk-sim-server",
-    "adk-agent-sim",
-  ]
-
-  for pkg in packages:
+  for pkg in PYTHON_PACKAGES:
     run(
       ["uv", "build", "--package", pkg, "--out-dir", str(output_dir)],
       cwd=REPO_ROOT,
@@ -438,6 +430,8 @@ def verify(
     ops ci verify                 Verify artifacts in ./dist/
     ops ci build && ops ci verify Build then verify
   """
+  import urllib.request
+
   require_tools("uv")
 
   console.print(Panel("Verifying Artifacts", style="blue"))
@@ -4,17 +4,16 @@ Uses Jujutsu (jj) for version control operations.
 """
 
 import json
+import re
 from enum import Enum
 from pathlib import Path
 
-import tomlkit
 import typer
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from ops.core import jj
 from ops.core.console import console
 from ops.core.github import GitHubClient
-from ops.core.paths import PACKAGES_DIR, REPO_ROOT
+from ops.core.paths import PACKAGES_DIR, PYTHON_PACKAGES, REPO_ROOT
 from ops.core.process import ExitCode, require_tools
 
 app = typer.Typer(help="Create and publish releases.")
@@ -31,7 +30,7 @@ class BumpType(str, Enum):
 def _get_current_version() -> str:
   """Read version from TypeScript package.json (source of truth)."""
   pkg = PACKAGES_DIR / "adk-sim-protos-ts" / "package.json"
-  return str(json.loads(pkg.read_text())["version"])
+  return str(json.loads(pkg.read_bytes())["version"])
 
 
 def _bump_version(current: str, bump: BumpType) -> str:
@@ -46,7 +45,7 @@ def _bump_version(current: str, bump: BumpType) -> str:
 
 
 # Python packages to update (relative to repo root)
-_PYTHON_PACKAGES = [
+_PYTHON_PYPROJECTS = [
   Path("packages/adk-sim-protos/pyproject.toml"),
   Path("packages/adk-sim-testing/pyproject.toml"),
   Path("server/pyproject.toml"),
@@ -60,13 +59,13 @@ _TS_PACKAGES = [
 ]
 
 # Internal package names that should use exact version pinning
-_INTERNAL_PACKAGES = frozenset(
-  {
-    "adk-sim-protos",
-    "adk-sim-testing",
-    "adk-sim-server",
-    "adk-agent-sim",
-  }
+_INTERNAL_PACKAGES = frozenset(PYTHON_PACKAGES)
+
+# An internal package name, an optional version specifier, and an optional
+# environment marker (kept verbatim when the specifier is re-pinned)
+_INTERNAL_DEP_RE = re.compile(
+  rf"({'|'.join(map(re.escape, sorted(_INTERNAL_PACKAGES)))})\s*"
+  r"(?:[<>=!~][^;]*)?(;.*)?"
 )
 
 
@@ -78,15 +77,35 @@ def _update_dependency_version(dep: str, version: str) -> str | None:
       version: The new version to pin to
 
   Returns:
-      Updated dependency string with exact version, or None if not an internal package
+      Updated dependency string with exact version and any environment marker
+      preserved, or None if not an internal package
   """
-  # Extract package name (before any version specifier)
-  package_name = dep.split(">=")[0].split("==")[0].split("<")[0].split(">")[0].strip()
+  match = _INTERNAL_DEP_RE.fullmatch(dep.strip())
+  if match is None:
+    return None
+  name, marker = match.groups()
+  return f"{name}=={version}{marker or ''}"
+
+
+def _pin_internal_deps(deps: list[object], version: str) -> bool:
+  """Pin internal packages in a tomlkit dependency array to the given version.
 
-  if package_name in _INTERNAL_PACKAGES:
-    return f"{package_name}=={version}"
+  Entries are replaced in place, so the array keeps its layout and comments.
+
+  Args:
+      deps: The tomlkit array of dependency strings
+      version: The version to pin to
 
-  return None
+  Returns:
+      True if any entry changed, False otherwise
+  """
+  changed = False
+  for i, dep in enumerate(deps):
+    updated = _update_dependency_version(str(dep), version)
+    if updated and dep != updated:
+      deps[i] = updated
+      changed = True
+  return changed
 
 
 def _update_pyproject(path: Path, version: str) -> bool:
@@ -99,6 +118,8 @@ def _update_pyproject(path: Path, version: str) -> bool:
   Returns:
       True if changes were made, False otherwise
   """
+  import tomlkit
+
   with path.open() as f:
     doc = tomlkit.load(f)
 
@@ -112,29 +133,15 @@ def _update_pyproject(path: Path, version: str) -> bool:
       changed = True
 
     # Update internal dependencies in project.dependencies
-    if "dependencies" in project:
-      deps = list(project["dependencies"])  # type: ignore[index]
-      for i, dep in enumerate(deps):
-        updated = _update_dependency_version(str(dep), version)
-        if updated and deps[i] != updated:
-          deps[i] = updated
-          changed = True
-      if changed:
-        project["dependencies"] = deps  # type: ignore[index]
+    project_deps = project.get("dependencies")  # type: ignore[union-attr]
+    if project_deps is not None and _pin_internal_deps(project_deps, version):
+      changed = True
 
   # Update internal dependencies in dependency-groups.dev (if present)
-  dep_groups = doc.get("dependency-groups")
-  if dep_groups is not None and "dev" in dep_groups:  # type: ignore[operator]
-    dev_deps = list(dep_groups["dev"])  # type: ignore[index]
-    deps_changed = False
-    for i, dep in enumerate(dev_deps):
-      updated = _update_dependency_version(str(dep), version)
-      if updated and dev_deps[i] != updated:
-        dev_deps[i] = updated
-        deps_changed = True
-    if deps_changed:
-      dep_groups["dev"] = dev_deps  # type: ignore[index]
-      changed = True
+  dep_groups = doc.get("dependency-groups") or {}
+  dev_group = dep_groups.get("dev")  # type: ignore[union-attr]
+  if dev_group is not None and _pin_internal_deps(dev_group, version):
+    changed = True
 
   if changed:
     with path.open("w") as f:
@@ -190,7 +197,7 @@ def _sync_versions(version: str, verbose: bool = False) -> None:
         console.print(f"[green]Updated {path}[/green]")
 
   # Update Python packages
-  for path in _PYTHON_PACKAGES:
+  for path in _PYTHON_PYPROJECTS:
     full_path = REPO_ROOT / path
     if not full_path.exists():
       if verbose:
@@ -218,18 +225,18 @@ def status() -> None:
 
   console.print(f"Current version: [cyan]{version}[/cyan]")
 
-  # Check working copy status via jj
-  status_output = jj.get_status()
-  if "The working copy has no changes" in status_output:
-    console.print("Working copy:    [green]clean[/green]")
-  else:
+  # Query working copy status, main ancestry, and bookmark concurrently
+  state = jj.prefetch_state()
+  if state.has_changes:
     console.print("Working copy:    [yellow]has changes[/yellow]")
+  else:
+    console.print("Working copy:    [green]clean[/green]")
 
   # Check if on main
-  if jj.is_on_main():
+  if state.on_main:
     console.print("On main:         [green]yes[/green]")
   else:
-    bookmark = jj.get_current_bookmark()
+    bookmark = state.current_bookmark
     if bookmark:
       console.print(f"Current bookmark: [cyan]{bookmark}[/cyan]")
     else:
@@ -318,6 +325,8 @@ def _do_release(
   5. Merge PR via GitHub
   6. Fetch merged changes, create and push tag
   """
+  from rich.progress import Progress, SpinnerColumn, TextColumn
+
   require_tools("jj", "gh")
 
   # 1. Validation
@@ -15,16 +15,18 @@ Examples:
 """
 
 import subprocess
+import tempfile
 from collections.abc import Generator
-from contextlib import contextmanager
-from typing import Annotated
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from typing import IO, Annotated
 
 import typer
 from rich.panel import Panel
 
 from ops.core.console import console
 from ops.core.paths import FRONTEND_DIR, REPO_ROOT
-from ops.core.process import require_tools, run
+from ops.core.process import ExitCode, require_tools, run
 
 # =============================================================================
 # E2E Backend Management
@@ -127,13 +129,33 @@ def run_server_e2e(verbose: bool = False) -> None:
   )
 
 
-def run_frontend_unit(verbose: bool = False) -> None:
-  """Run frontend Vitest unit tests."""
+def run_python_unit(verbose: bool = False) -> None:
+  """Run server unit and Python plugin tests in a single pytest session.
+
+  Sharing one session pays pytest startup and conftest collection once
+  instead of once per suite.
+  """
+  run(
+    ["uv", "run", "pytest", "server/tests/unit", "plugins/python/tests", "-v"],
+    cwd=REPO_ROOT,
+    verbose=verbose,
+  )
+
+
+def run_frontend_unit(verbose: bool = False, capture: bool = False) -> None:
+  """Run frontend Vitest unit tests.
+
+  Args:
+    verbose: Show detailed output.
+    capture: Capture output instead of writing it to the terminal, so the
+      suite can run alongside another one. Output is shown only on failure.
+  """
   run(
     ["npm", "run", "test"],
     cwd=FRONTEND_DIR,
     env={"CI": "true"},
     verbose=verbose,
+    capture=capture,
   )
 
 
@@ -262,16 +284,87 @@ def update_frontend_component_snapshots(
     )
 
 
-def run_frontend_e2e(verbose: bool = False, trace: bool = False) -> None:
+def _kill_if_running(proc: subprocess.Popen[str]) -> None:
+  """Kill and reap a process unless it has already exited."""
+  if proc.poll() is None:
+    proc.kill()
+    proc.wait()
+
+
+def _run_playwright_shards(cmd: list[str], shards: int, verbose: bool) -> None:
+  """Run a Playwright command as concurrent `--shard=i/N` processes.
+
+  Each shard writes artifacts to its own `test-results/shard-<i>` directory,
+  since Playwright clears its output directory when a run starts. Output is
+  spooled to a temp file per shard (so no shard blocks on a full pipe) and
+  only printed for shards that fail, unless verbose.
+
+  Shards always use the line reporter: reporters from playwright.config.ts
+  (such as the CI HTML report) would write to one shared location, and
+  per-shard reports are not merged. Shards still running when this exits
+  early (Ctrl-C, or a failed launch) are killed.
+  """
+  failed: list[int] = []
+  with ExitStack() as stack:
+    procs: list[tuple[int, subprocess.Popen[str], IO[str]]] = []
+    for i in range(1, shards + 1):
+      shard_cmd = [
+        *cmd,
+        f"--shard={i}/{shards}",
+        "--output",
+        f"test-results/shard-{i}",
+        "--reporter",
+        "line",
+      ]
+      if verbose:
+        console.print(f"[dim]$ {' '.join(shard_cmd)}[/dim]")
+      log = stack.enter_context(tempfile.TemporaryFile("w+"))
+      proc = subprocess.Popen(
+        shard_cmd,
+        cwd=FRONTEND_DIR,
+        stdout=log,
+        stderr=subprocess.STDOUT,
+        text=True,
+      )
+      stack.callback(_kill_if_running, proc)
+      procs.append((i, proc, log))
+
+    for i, proc, log in procs:
+      proc.wait()
+      if verbose or proc.returncode != 0:
+        log.seek(0)
+        console.print(f"[dim]--- shard {i}/{shards} ---[/dim]")
+        console.print(log.read(), markup=False, highlight=False)
+      if proc.returncode != 0:
+        failed.append(i)
+
+  if failed:
+    shard_list = ", ".join(f"{i}/{shards}" for i in failed)
+    console.print(f"[red]Error:[/red] Playwright shards failed: {shard_list}")
+    raise typer.Exit(ExitCode.EXTERNAL)
+
+
+def run_frontend_e2e(
+  verbose: bool = False, trace: bool = False, shards: int = 1
+) -> None:
   """Run Playwright E2E tests.
 
   Automatically starts/stops E2E Docker backends as needed.
+
+  Args:
+    verbose: Show detailed output.
+    trace: Record traces for all tests.
+    shards: Number of concurrent Playwright processes to split the suite
+      across. 1 runs a single Playwright invocation.
   """
   with e2e_backends(verbose):
     cmd = ["npm", "exec", "playwright", "test", "--", "-c", "playwright.config.ts"]
     if trace:
       cmd.extend(["--trace", "on"])
-    run(cmd, cwd=FRONTEND_DIR, verbose=verbose)
+    if shards > 1:
+      _run_playwright_shards(cmd, shards, verbose)
+    else:
+      run(cmd, cwd=FRONTEND_DIR, verbose=verbose)
 
 
 def update_frontend_e2e_snapshots(verbose: bool = False) -> None:
@@ -364,14 +457,24 @@ def frontend_e2e(
   trace: bool = typer.Option(
     False, "--trace", help="Generate traces for all tests (slower)"
   ),
+  shards: int = typer.Option(
+    1,
+    "--shards",
+    min=1,
+    help=(
+      "Split E2E tests across N concurrent Playwright runs "
+      "(N > 1 uses the line reporter; configured reports are not produced)"
+    ),
+  ),
   verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed output"),
 ) -> None:
   """
   Run frontend E2E tests (Playwright E2E + component tests).
 
   Examples:
-    ops test frontend e2e           Run E2E and component tests
-    ops test frontend e2e --trace   Run with full trace capture
+    ops test frontend e2e             Run E2E and component tests
+    ops test frontend e2e --trace     Run with full trace capture
+    ops test frontend e2e --shards 2  Split E2E tests across 2 processes
   """
   require_tools("npm")
   console.print(Panel("Frontend E2E Tests", style="blue"))
@@ -384,7 +487,7 @@ def frontend_e2e(
   console.print("[green]![/green] Component tests passed")
 
   console.print("\n[bold]Running E2E tests...[/bold]")
-  run_frontend_e2e(verbose, trace=trace)
+  run_frontend_e2e(verbose, trace=trace, shards=shards)
   console.print("[green]![/green] E2E tests passed")
 
   console.print("\n[green]! All frontend E2E tests passed![/green]")
@@ -610,17 +713,31 @@ def all_unit(
   require_tools("npm", "uv")
   console.print(Panel("All Unit Tests", style="blue"))
 
-  console.print("\n[bold]Running server unit tests...[/bold]")
-  run_server_unit(verbose)
-  console.print("[green]![/green] Server unit tests passed")
-
-  console.print("\n[bold]Running frontend unit tests...[/bold]")
-  run_frontend_unit(verbose)
-  console.print("[green]![/green] Frontend unit tests passed")
-
-  console.print("\n[bold]Running plugin tests...[/bold]")
-  run_plugin_python(verbose)
-  console.print("[green]![/green] Plugin tests passed")
+  # Vitest runs in the background with captured output while the combined
+  # server + plugin pytest session streams to the terminal. Both outcomes
+  # are reported, so a Python failure doesn't hide a frontend one.
+  failures: list[tuple[str, int]] = []
+  console.print("\n[bold]Running server and plugin unit tests...[/bold]")
+  console.print("[dim]Frontend unit tests running in the background[/dim]")
+  with ThreadPoolExecutor(max_workers=1) as pool:
+    frontend = pool.submit(run_frontend_unit, verbose, capture=True)
+    try:
+      run_python_unit(verbose)
+      console.print("[green]![/green] Server and plugin unit tests passed")
+    except typer.Exit as e:
+      failures.append(("server and plugin", e.exit_code))
+
+    console.print("\n[bold]Waiting for frontend unit tests...[/bold]")
+    try:
+      frontend.result()
+      console.print("[green]![/green] Frontend unit tests passed")
+    except typer.Exit as e:
+      failures.append(("frontend", e.exit_code))
+
+  if failures:
+    suites = ", ".join(name for name, _ in failures)
+    console.print(f"\n[red]Error:[/red] Unit tests failed: {suites}")
+    raise typer.Exit(failures[0][1])
 
   console.print("\n[green]! All unit tests passed![/green]")
 
@@ -631,6 +748,17 @@ def all_e2e(
     bool,
     typer.Option("--trace", help="Generate traces for frontend E2E tests"),
   ] = False,
+  shards: Annotated[
+    int,
+    typer.Option(
+      "--shards",
+      min=1,
+      help=(
+        "Split frontend E2E tests across N Playwright runs "
+        "(N > 1 uses the line reporter; configured reports are not produced)"
+      ),
+    ),
+  ] = 1,
   verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed output"),
 ) -> None:
   """
@@ -652,7 +780,7 @@ def all_e2e(
   console.print("[green]![/green] Frontend component tests passed")
 
   console.print("\n[bold]Running frontend E2E tests...[/bold]")
-  run_frontend_e2e(verbose, trace=trace)
+  run_frontend_e2e(verbose, trace=trace, shards=shards)
   console.print("[green]![/green] Frontend E2E tests passed")
 
   console.print("\n[bold]Running server E2E tests...[/bold]")
@@ -8,9 +8,11 @@ Examples:
   ops trace list              List all available traces
 """
 
+import os
 from pathlib import Path
 
 import typer
+from rich.prompt import IntPrompt
 from rich.table import Table
 
 from ops.core.console import console
@@ -25,38 +27,55 @@ app = typer.Typer(
 TRACE_DIR = FRONTEND_DIR / "test-results"
 
 
-def _find_traces() -> list[tuple[str, Path]]:
+def _find_traces() -> list[tuple[str, str, Path]]:
   """Find all trace.zip files in the test-results directory.
 
+  Walks the tree with os.scandir so each entry's type comes back with the
+  directory read, and only trace files are stat'ed (for their mtime),
+  rather than every entry as with Path.rglob.
+
   Returns:
-      List of (display_name, trace_path) tuples, sorted by mtime (newest first).
+      List of (display_name, lowercased_name, trace_path) tuples, sorted by
+      mtime (newest first). The lowercased name is computed once here for
+      case-insensitive name matching.
   """
   if not TRACE_DIR.exists():
     return []
 
   traces: list[tuple[str, Path, float]] = []
 
-  # Find all trace.zip files
-  for trace_path in TRACE_DIR.rglob("trace.zip"):
-    # Get the test name from the parent directory
-    test_dir = trace_path.parent
-    display_name = test_dir.name
-
-    # Get modification time for sorting
-    mtime = trace_path.stat().st_mtime
-    traces.append((display_name, trace_path, mtime))
+  # Explicit stack-based walk of the test-results tree
+  pending = [str(TRACE_DIR)]
+  while pending:
+    try:
+      with os.scandir(pending.pop()) as entries:
+        for entry in entries:
+          if entry.is_dir(follow_symlinks=False):
+            pending.append(entry.path)
+          elif entry.name == "trace.zip":
+            try:
+              mtime = entry.stat().st_mtime
+            except OSError:
+              # Trace removed between listing and stat; keep scanning siblings
+              continue
+            # The test name is the name of the parent directory
+            trace_path = Path(entry.path)
+            traces.append((trace_path.parent.name, trace_path, mtime))
+    except OSError:
+      # Directory vanished or is unreadable (e.g. mid-cleanup by Playwright)
+      continue
 
   # Sort by modification time (newest first)
   traces.sort(key=lambda x: x[2], reverse=True)
 
-  return [(name, path) for name, path, _ in traces]
+  return [(name, name.lower(), path) for name, path, _ in traces]
 
 
-def _select_trace(traces: list[tuple[str, Path]]) -> Path | None:
+def _select_trace(traces: list[tuple[str, str, Path]]) -> Path | None:
   """Present an interactive selection menu for traces.
 
   Args:
-      traces: List of (display_name, trace_path) tuples.
+      traces: List of (display_name, lowercased_name, trace_path) tuples.
 
   Returns:
       Selected trace path, or None if cancelled.
@@ -64,32 +83,28 @@ def _select_trace(traces: list[tuple[str, Path]]) -> Path | None:
   console.print("\n[bold]Available traces:[/bold]\n")
 
   # Display numbered list
-  for i, (name, path) in enumerate(traces, 1):
+  for i, (name, _, path) in enumerate(traces, 1):
     # Get file size
     size_kb = path.stat().st_size / 1024
     console.print(f"  [cyan]{i:2}[/cyan]. {name} [dim]({size_kb:.0f} KB)[/dim]")
 
   console.print()
 
-  # Prompt for selection
-  while True:
-    try:
-      choice = console.input("[bold]Select trace number (or 'q' to quit):[/bold] ")
-
-      if choice.lower() in ("q", "quit", "exit"):
-        return None
-
-      index = int(choice) - 1
-      if 0 <= index < len(traces):
-        return traces[index][1]
-
-      console.print(f"[red]Invalid selection. Enter 1-{len(traces)}[/red]")
+  # Prompt for selection; IntPrompt re-asks until the input is a valid choice
+  try:
+    choice = IntPrompt.ask(
+      "[bold]Select trace number (or 0 to quit)[/bold]",
+      console=console,
+      choices=[str(i) for i in range(len(traces) + 1)],
+      show_choices=False,
+    )
+  except KeyboardInterrupt:
+    console.print()
+    return None
 
-    except ValueError:
-      console.print("[red]Please enter a number[/red]")
-    except KeyboardInterrupt:
-      console.print()
-      return None
+  if choice == 0:
+    return None
+  return traces[choice - 1][2]
 
 
 @app.callback(invoke_without_command=True)
@@ -127,7 +142,7 @@ def list_traces() -> None:
   table.add_column("Size", style="dim", justify="right")
   table.add_column("Path", style="dim")
 
-  for i, (name, path) in enumerate(traces, 1):
+  for i, (name, _, path) in enumerate(traces, 1):
     size_kb = path.stat().st_size / 1024
     # Show relative path from repo root
     rel_path = path.relative_to(FRONTEND_DIR.parent)
@@ -182,24 +197,25 @@ def view_trace(
     # Selection by number
     index = int(name) - 1
     if 0 <= index < len(traces):
-      trace_path = traces[index][1]
+      trace_path = traces[index][2]
     else:
       console.print(f"[red]Invalid trace number. Available: 1-{len(traces)}[/red]")
       raise typer.Exit(1)
 
   else:
     # Search by name (partial match)
-    matches = [(n, p) for n, p in traces if name.lower() in n.lower()]
+    needle = name.lower()
+    matches = [trace for trace in traces if needle in trace[1]]
 
     if len(matches) == 0:
       console.print(f"[red]No trace found matching '{name}'[/red]")
       console.print("\nAvailable traces:")
-      for trace_name, _ in traces:
+      for trace_name, _, _ in traces:
         console.print(f"  - {trace_name}")
       raise typer.Exit(1)
 
     if len(matches) == 1:
-      trace_path = matches[0][1]
+      trace_path = matches[0][2]
 
     else:
       console.print(f"[yellow]Multiple traces match '{name}':[/yellow]")
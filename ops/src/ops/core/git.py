@@ -83,10 +83,13 @@ def get_merge_base(upstream: str = "origin/main") -> str:
 
 
 def get_changed_files(since: str = "origin/main") -> list[str]:
-  """Get list of files changed since a given ref."""
-  merge_base = get_merge_base(since)
+  """Get list of files changed since a given ref.
+
+  Uses the `since...HEAD` range so git resolves the merge base itself,
+  avoiding a separate `git merge-base` process.
+  """
   result = subprocess.run(
-    ["git", "diff", "--name-only", merge_base, "HEAD"],
+    ["git", "diff", "--name-only", f"{since}...HEAD"],
     cwd=REPO_ROOT,
     capture_output=True,
     text=True,
@@ -2,6 +2,7 @@
 
 import json
 import subprocess
+import time
 from dataclasses import dataclass
 
 import typer
@@ -114,8 +115,6 @@ class GitHubClient:
     Polls the GitHub API instead of using `gh pr checks --watch` which
     requires an interactive terminal.
     """
-    import time
-
     start = time.time()
     timeout_seconds = timeout_minutes * 60
 
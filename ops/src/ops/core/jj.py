@@ -2,37 +2,86 @@
 
 This project uses Jujutsu exclusively for version control.
 Git commands should only be used via jj (e.g., jj git push).
+
+A release issues dozens of short jj processes, so every call here keeps to
+the vfork-eligible subprocess options described in ops.core.process.
 """
 
+import shlex
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cache
 
 import typer
+from rich.markup import escape
 
 from ops.core.console import console
 from ops.core.paths import REPO_ROOT
 from ops.core.process import ExitCode
 
+# One jj template that renders every per-revision field we query
+_REVISION_TEMPLATE = 'change_id ++ "\t" ++ commit_id ++ "\t" ++ bookmarks ++ "\n"'
+
+
+@dataclass(frozen=True)
+class RevisionInfo:
+  """Identifiers and bookmarks for a single revision."""
+
+  change_id: str
+  commit_id: str
+  bookmarks: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class StateSnapshot:
+  """Working-copy state gathered by prefetch_state."""
+
+  has_changes: bool
+  on_main: bool
+  current_bookmark: str | None
+
+
+def invalidate_jj_cache() -> None:
+  """Clear memoized jj query results.
 
+  Read-only queries are cached for the life of the process. Mutating jj
+  commands run through _run_jj, which calls this automatically; call it
+  directly after editing working-copy files outside of jj.
+  """
+  get_status.cache_clear()
+  has_uncommitted_changes.cache_clear()
+  is_on_main.cache_clear()
+  _query_revision.cache_clear()
+
+
+@cache
 def get_status() -> str:
-  """Get jj status output."""
-  result = subprocess.run(
-    ["jj", "status", "--no-pager"],
-    cwd=REPO_ROOT,
-    capture_output=True,
-    text=True,
-  )
+  """Get jj status output. Cached until the next mutating jj command."""
+  output = _query(["jj", "status", "--no-pager"])
 
-  if result.returncode != 0:
+  if output is None:
     console.print("[red]Error:[/red] Failed to check jj status")
     raise typer.Exit(ExitCode.EXTERNAL)
 
-  return result.stdout
+  return output
 
 
+@cache
 def has_uncommitted_changes() -> bool:
-  """Check if working copy has uncommitted changes."""
-  status = get_status()
-  return "The working copy has no changes" not in status
+  """Check if working copy has uncommitted changes.
+
+  Uses the file summary of `jj diff` rather than matching text in the full
+  status report: jj prints one short line per changed file and nothing at
+  all for a clean working copy. Cached like get_status.
+  """
+  output = _query(["jj", "diff", "--summary", "--no-pager"])
+
+  if output is None:
+    console.print("[red]Error:[/red] Failed to check jj status")
+    raise typer.Exit(ExitCode.EXTERNAL)
+
+  return bool(output.strip())
 
 
 def ensure_clean_working_copy() -> None:
@@ -54,34 +103,41 @@ def ensure_clean_working_copy() -> None:
 
 def get_current_bookmark() -> str | None:
   """Get the bookmark pointing to the current working copy parent, if any."""
-  result = subprocess.run(
-    ["jj", "log", "-r", "@-", "--no-graph", "-T", 'bookmarks ++ "\n"'],
-    cwd=REPO_ROOT,
-    capture_output=True,
-    text=True,
-  )
-
-  if result.returncode != 0:
-    return None
-
-  # Parse bookmarks (may be multiple, space-separated)
-  bookmarks = result.stdout.strip()
-  if not bookmarks:
+  info = _query_revision("@-")
+  if info is None or not info.bookmarks:
     return None
 
   # Return first bookmark
-  return bookmarks.split()[0] if bookmarks else None
+  return info.bookmarks[0]
 
 
+@cache
 def is_on_main() -> bool:
   """Check if current working copy parent is on main."""
-  result = subprocess.run(
+  output = _query(
     ["jj", "log", "-r", "@- & main", "--no-graph", "-T", "change_id"],
-    cwd=REPO_ROOT,
-    capture_output=True,
-    text=True,
+    snapshot=False,
   )
-  return result.returncode == 0 and bool(result.stdout.strip())
+  return bool(output and output.strip())
+
+
+def prefetch_state() -> StateSnapshot:
+  """Run the independent working-copy queries concurrently.
+
+  Each query is a separate jj process, so overlapping them cuts wall time
+  to roughly the slowest one. Results land in the query caches, so later
+  calls to has_uncommitted_changes, is_on_main, or get_current_bookmark
+  are free.
+  """
+  with ThreadPoolExecutor(max_workers=3) as pool:
+    has_changes = pool.submit(has_uncommitted_changes)
+    on_main = pool.submit(is_on_main)
+    bookmark = pool.submit(get_current_bookmark)
+    return StateSnapshot(
+      has_changes=has_changes.result(),
+      on_main=on_main.result(),
+      current_bookmark=bookmark.result(),
+    )
 
 
 def describe(message: str, verbose: bool = False) -> None:
@@ -165,7 +221,7 @@ def git_push_tag(tag: str, revision: str = "main", verbose: bool = False) -> Non
   if result.returncode != 0:
     console.print(f"[red]Error:[/red] Failed to create tag {tag}")
     if not verbose and result.stderr:
-      console.print(result.stderr)
+      console.print(result.stderr, markup=False, highlight=False)
     raise typer.Exit(ExitCode.EXTERNAL)
 
   # Push the tag (with --no-verify to skip pre-commit hooks)
@@ -178,7 +234,7 @@ def git_push_tag(tag: str, revision: str = "main", verbose: bool = False) -> Non
   if result.returncode != 0:
     console.print(f"[red]Error:[/red] Failed to push tag {tag}")
     if not verbose and result.stderr:
-      console.print(result.stderr)
+      console.print(result.stderr, markup=False, highlight=False)
     raise typer.Exit(ExitCode.EXTERNAL)
 
 
@@ -197,54 +253,106 @@ def abandon(revision: str, verbose: bool = False) -> None:
   _run_jj(["jj", "abandon", revision], verbose=verbose)
 
 
+def _snapshot_working_copy() -> None:
+  """Make sure jj has snapshotted the working copy since the last mutation.
+
+  Any jj query run without --ignore-working-copy snapshots as a side effect.
+  has_uncommitted_changes is such a query and stays cached until the next
+  mutating command, so this runs at most one jj process per cache lifetime.
+  """
+  has_uncommitted_changes()
+
+
+@cache
+def _query_revision(revision: str) -> RevisionInfo | None:
+  """Fetch change ID, commit ID, and bookmarks for a revision in one jj call.
+
+  Never snapshots the working copy; callers that may read @ call
+  _snapshot_working_copy first. Returns None if jj fails (e.g. the revision
+  does not exist). If the revset matches several revisions, the first one
+  jj prints is used.
+  """
+  output = _query(
+    ["jj", "log", "-r", revision, "--no-graph", "-T", _REVISION_TEMPLATE],
+    snapshot=False,
+  )
+
+  if not output or not output.strip():
+    return None
+
+  change_id, commit_id, bookmarks = output.splitlines()[0].split("\t")
+  return RevisionInfo(
+    change_id=change_id,
+    commit_id=commit_id,
+    bookmarks=tuple(bookmarks.split()),
+  )
+
+
 def get_change_id(revision: str = "@") -> str:
   """Get the change ID for a revision."""
-  result = subprocess.run(
-    ["jj", "log", "-r", revision, "--no-graph", "-T", "change_id"],
-    cwd=REPO_ROOT,
-    capture_output=True,
-    text=True,
-  )
+  _snapshot_working_copy()
+  info = _query_revision(revision)
 
-  if result.returncode != 0:
+  if info is None:
     console.print(f"[red]Error:[/red] Failed to get change ID for {revision}")
     raise typer.Exit(ExitCode.EXTERNAL)
 
-  return result.stdout.strip()
+  return info.change_id
 
 
 def get_commit_id(revision: str = "@") -> str:
   """Get the commit ID (git hash) for a revision."""
-  result = subprocess.run(
-    ["jj", "log", "-r", revision, "--no-graph", "-T", "commit_id"],
-    cwd=REPO_ROOT,
-    capture_output=True,
-    text=True,
-  )
+  _snapshot_working_copy()
+  info = _query_revision(revision)
 
-  if result.returncode != 0:
+  if info is None:
     console.print(f"[red]Error:[/red] Failed to get commit ID for {revision}")
     raise typer.Exit(ExitCode.EXTERNAL)
 
-  return result.stdout.strip()
+  return info.commit_id
+
+
+def _query(cmd: list[str], *, snapshot: bool = True) -> str | None:
+  """Run a read-only jj query and return its stdout, or None on failure.
+
+  Reads raw bytes and decodes once, skipping the text-mode pipe wrappers
+  and CompletedProcess bookkeeping of subprocess.run for these tiny outputs.
+
+  With snapshot=False, jj skips scanning the working copy for changes
+  (--ignore-working-copy). Snapshotting only rewrites the @ commit, so this
+  is safe for queries that never read @ itself (e.g. @- or main) or that run
+  after a snapshot, and it keeps concurrent queries in prefetch_state from
+  snapshotting in parallel.
+  """
+  if not snapshot:
+    cmd = [*cmd, "--ignore-working-copy"]
+  try:
+    output = subprocess.check_output(cmd, cwd=REPO_ROOT, stderr=subprocess.DEVNULL)
+  except subprocess.CalledProcessError:
+    return None
+  return output.decode()
 
 
 def _run_jj(
   cmd: list[str], *, verbose: bool = False
 ) -> subprocess.CompletedProcess[str]:
-  """Run a jj command with error handling."""
+  """Run a mutating jj command with error handling.
+
+  Clears the query cache afterwards, since the command may have changed
+  the working copy, bookmarks, or commit graph.
+  """
   result = subprocess.run(
     cmd,
     cwd=REPO_ROOT,
     capture_output=not verbose,
     text=True,
   )
+  invalidate_jj_cache()
 
   if result.returncode != 0:
-    cmd_str = " ".join(cmd)
-    console.print(f"[red]Error:[/red] Command failed: {cmd_str}")
+    console.print(f"[red]Error:[/red] Command failed: {escape(shlex.join(cmd))}")
     if not verbose and result.stderr:
-      console.print(result.stderr)
+      console.print(result.stderr, markup=False, highlight=False)
     raise typer.Exit(ExitCode.EXTERNAL)
 
   return result
@@ -1,5 +1,6 @@
 """Project path constants."""
 
+import itertools
 import os
 from pathlib import Path
 
@@ -7,18 +8,21 @@ from pathlib import Path
 def _find_repo_root() -> Path:
   """Find the repository root.
 
-  First checks the ADK_SIM_REPO_ROOT environment variable,
-  then checks the current working directory for repo markers.
+  First checks the ADK_SIM_REPO_ROOT environment variable, then walks up
+  from the current working directory looking for repo markers.
   """
   # Check environment variable first
   env_root = os.environ.get("ADK_SIM_REPO_ROOT")
   if env_root:
     return Path(env_root)
 
-  # Check current working directory and its parents
   cwd = Path.cwd().resolve()
-  for path in [cwd, *cwd.parents]:
-    if (path / "pyproject.toml").exists() and (path / "server").exists():
+
+  # Check current working directory and its parents
+  # Check the rarer marker first: sub-packages like server/ and ops/ have
+  # their own pyproject.toml, so most levels are rejected with one stat
+  for path in itertools.chain((cwd,), cwd.parents):
+    if (path / "server").is_dir() and (path / "pyproject.toml").is_file():
       return path
 
   # Fallback to cwd (may fail later if not in repo)
@@ -40,3 +44,11 @@ TS_PROTOS_DIR = PACKAGES_DIR / "adk-sim-protos-ts" / "src"
 
 # Staleness marker for proto generation
 PROTO_MARKER = REPO_ROOT / ".proto-generated"
+
+# Python workspace packages, in dependency (build) order
+PYTHON_PACKAGES = (
+  "adk-sim-protos",
+  "adk-sim-testing",
+  "adk-sim-server",
+  "adk-agent-sim",
+)
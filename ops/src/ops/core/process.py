@@ -1,12 +1,22 @@
-"""Subprocess execution utilities."""
+"""Subprocess execution utilities.
 
+Commands are launched through the subprocess module, which on Linux starts
+children with vfork()/posix_spawn() instead of a full fork() as long as no
+preexec_fn, process_group, or user/group switch is requested. Avoid those
+options here so launching a command never copies this process's page tables.
+"""
+
+import functools
 import os
+import shlex
 import shutil
+import signal
 import subprocess
 from enum import IntEnum
 from pathlib import Path
 
 import typer
+from rich.markup import escape
 
 from ops.core.console import console
 
@@ -49,12 +59,16 @@ def run(
   Raises:
     typer.Exit: On failure with helpful message
   """
-  full_env = os.environ.copy()
-  if env:
-    full_env.update(env)
+  # Only build a merged environment when overrides are given; env=None
+  # lets the child inherit ours without copying it
+  full_env = {**os.environ, **env} if env else None
 
-  if verbose:
-    console.print(f"[dim]$ {' '.join(cmd)}[/dim]")
+  # Rendered at most once: here when verbose, otherwise only on failure.
+  # shlex.join quotes arguments with spaces, so the echo can be pasted back
+  cmd_str = shlex.join(cmd) if verbose else None
+  if cmd_str is not None:
+    # The command is plain text; skip markup parsing (and bracket mangling)
+    console.print(f"$ {cmd_str}", style="dim", markup=False, highlight=False)
 
   try:
     return subprocess.run(
@@ -67,11 +81,15 @@ def run(
       input=input_data,
     )
   except subprocess.CalledProcessError as e:
-    console.print(f"[red]Error:[/red] Command failed: {' '.join(cmd)}")
+    if cmd_str is None:
+      cmd_str = shlex.join(cmd)
+    console.print(f"[red]Error:[/red] Command failed: {escape(cmd_str)}")
+    # Raw tool output: skip markup parsing and highlighting, which are
+    # wasted work here and can choke on bracketed text like "[/tmp]"
     if e.stdout:
-      console.print(e.stdout)
+      console.print(e.stdout, markup=False, highlight=False)
     if e.stderr:
-      console.print(e.stderr, style="red")
+      console.print(e.stderr, style="red", markup=False, highlight=False)
     raise typer.Exit(ExitCode.EXTERNAL) from None
   except FileNotFoundError:
     console.print(f"[red]Error:[/red] Command not found: {cmd[0]}")
@@ -80,17 +98,54 @@ def run(
     raise typer.Exit(ExitCode.PREREQ) from None
 
 
-def kill_port(port: int) -> bool:
-  """Kill any process listening on the given port.
+# TCP_LISTEN in the "st" column of /proc/net/tcp{,6}
+_TCP_LISTEN = "0A"
 
-  Uses lsof to find processes and SIGKILL to terminate them.
 
-  Args:
-    port: The port number to free up
+def _listening_socket_inodes(port: int) -> set[str] | None:
+  """Find inodes of TCP sockets listening on a port by reading /proc/net.
 
-  Returns:
-    True if a process was killed, False if port was already free
+  Returns None when /proc/net/tcp is unavailable (e.g. macOS).
   """
+  tables = [Path("/proc/net/tcp"), Path("/proc/net/tcp6")]
+  if not tables[0].exists():
+    return None
+
+  inodes: set[str] = set()
+  for table in tables:
+    try:
+      lines = table.read_text().splitlines()[1:]  # Skip header row
+    except OSError:
+      continue
+    for line in lines:
+      # Columns: sl local_address rem_address st ... uid timeout inode
+      fields = line.split()
+      local_port = int(fields[1].rsplit(":", 1)[1], 16)
+      if local_port == port and fields[3] == _TCP_LISTEN:
+        inodes.add(fields[9])
+  return inodes
+
+
+def _pids_holding_sockets(inodes: set[str]) -> set[int]:
+  """Find processes with an open file descriptor on any of the sockets."""
+  targets = {f"socket:[{inode}]" for inode in inodes}
+  pids: set[int] = set()
+  with os.scandir("/proc") as procs:
+    for proc in procs:
+      if not proc.name.isdigit():
+        continue
+      try:
+        with os.scandir(f"{proc.path}/fd") as fds:
+          if any(os.readlink(fd.path) in targets for fd in fds):
+            pids.add(int(proc.name))
+      except OSError:
+        # Process exited or belongs to another user
+        continue
+  return pids
+
+
+def _pids_from_lsof(port: int) -> set[int]:
+  """Find processes using a port via lsof (for platforms without /proc)."""
   result = subprocess.run(
     ["lsof", "-ti", f":{port}"],
     capture_output=True,
@@ -98,15 +153,49 @@ def kill_port(port: int) -> bool:
     check=False,
   )
 
-  if result.returncode != 0 or not result.stdout.strip():
+  if result.returncode != 0:
+    return set()
+  return {int(pid) for pid in result.stdout.split()}
+
+
+def kill_port(port: int) -> bool:
+  """Kill any process listening on the given port.
+
+  On Linux, reads /proc/net/tcp{,6} to find the listening socket and
+  /proc/<pid>/fd to find its owners, without spawning any helper process.
+  Elsewhere falls back to lsof. Matching processes get SIGKILL.
+
+  Args:
+    port: The port number to free up
+
+  Returns:
+    True if a process was killed, False if port was already free
+  """
+  inodes = _listening_socket_inodes(port)
+  if inodes is None:
+    pids = _pids_from_lsof(port)
+  elif not inodes:
+    # Nothing is listening, so skip scanning every process's descriptors
     return False
+  else:
+    pids = _pids_holding_sockets(inodes)
 
-  pids = result.stdout.strip().split("\n")
+  killed = False
   for pid in pids:
-    if pid:
-      subprocess.run(["kill", "-9", pid], check=False)
+    try:
+      os.kill(pid, signal.SIGKILL)
+      killed = True
+    except OSError:
+      # Already gone, or not ours to kill
+      continue
+
+  return killed
+
 
-  return True
+@functools.cache
+def _tool_available(tool: str) -> bool:
+  """Check whether a tool is on PATH, memoized for the life of the process."""
+  return shutil.which(tool) is not None
 
 
 def require_tools(*tools: str) -> None:
@@ -121,7 +210,7 @@ def require_tools(*tools: str) -> None:
     "docker": "Install Docker Desktop from https://docker.com/",
   }
 
-  missing = [tool for tool in tools if shutil.which(tool) is None]
+  missing = [tool for tool in tools if not _tool_available(tool)]
 
   if missing:
     console.print(f"[red]Error:[/red] Missing required tools: {', '.join(missing)}")
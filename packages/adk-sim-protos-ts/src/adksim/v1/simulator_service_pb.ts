@@ -19,7 +19,7 @@ import type { Message } from '@bufbuild/protobuf';
 export const file_adksim_v1_simulator_service: GenFile =
   /*@__PURE__*/
   fileDesc(
-    'CiFhZGtzaW0vdjEvc2ltdWxhdG9yX3NlcnZpY2UucHJvdG8SCWFka3NpbS52MSIrChRDcmVhdGVTZXNzaW9uUmVxdWVzdBITCgtkZXNjcmlwdGlvbhgBIAEoCSJFChVDcmVhdGVTZXNzaW9uUmVzcG9uc2USLAoHc2Vzc2lvbhgBIAEoCzIbLmFka3NpbS52MS5TaW11bGF0b3JTZXNzaW9uIjkKEFN1YnNjcmliZVJlcXVlc3QSEgoKc2Vzc2lvbl9pZBgBIAEoCRIRCgljbGllbnRfaWQYAiABKAkiOwoRU3Vic2NyaWJlUmVzcG9uc2USJgoFZXZlbnQYASABKAsyFy5hZGtzaW0udjEuU2Vzc2lvbkV2ZW50Ip0BChRTdWJtaXRSZXF1ZXN0UmVxdWVzdBISCgpzZXNzaW9uX2lkGAEgASgJEg8KB3R1cm5faWQYAiABKAkSEgoKYWdlbnRfbmFtZRgDIAEoCRJMCgdyZXF1ZXN0GAQgASgLMjsuZ29vZ2xlLmFpLmdlbmVyYXRpdmVsYW5ndWFnZS52MWJldGEuR2VuZXJhdGVDb250ZW50UmVxdWVzdCIpChVTdWJtaXRSZXF1ZXN0UmVzcG9uc2USEAoIZXZlbnRfaWQYASABKAkijAEKFVN1Ym1pdERlY2lzaW9uUmVxdWVzdBISCgpzZXNzaW9uX2lkGAEgASgJEg8KB3R1cm5faWQYAiABKAkSTgoIcmVzcG9uc2UYAyABKAsyPC5nb29nbGUuYWkuZ2VuZXJhdGl2ZWxhbmd1YWdlLnYxYmV0YS5HZW5lcmF0ZUNvbnRlbnRSZXNwb25zZSIqChZTdWJtaXREZWNpc2lvblJlc3BvbnNlEhAKCGV2ZW50X2lkGAEgASgJIjwKE0xpc3RTZXNzaW9uc1JlcXVlc3QSEQoJcGFnZV9zaXplGAEgASgFEhIKCnBhZ2VfdG9rZW4YAiABKAkiXgoUTGlzdFNlc3Npb25zUmVzcG9uc2USLQoIc2Vzc2lvbnMYASADKAsyGy5hZGtzaW0udjEuU2ltdWxhdG9yU2Vzc2lvbhIXCg9uZXh0X3BhZ2VfdG9rZW4YAiABKAkyrAMKEFNpbXVsYXRvclNlcnZpY2USUgoNQ3JlYXRlU2Vzc2lvbhIfLmFka3NpbS52MS5DcmVhdGVTZXNzaW9uUmVxdWVzdBogLmFka3NpbS52MS5DcmVhdGVTZXNzaW9uUmVzcG9uc2USSAoJU3Vic2NyaWJlEhsuYWRrc2ltLnYxLlN1YnNjcmliZVJlcXVlc3QaHC5hZGtzaW0udjEuU3Vic2NyaWJlUmVzcG9uc2UwARJSCg1TdWJtaXRSZXF1ZXN0Eh8uYWRrc2ltLnYxLlN1Ym1pdFJlcXVlc3RSZXF1ZXN0GiAuYWRrc2ltLnYxLlN1Ym1pdFJlcXVlc3RSZXNwb25zZRJVCg5TdWJtaXREZWNpc2lvbhIgLmFka3NpbS52MS5TdWJtaXREZWNpc2lvblJlcXVlc3QaIS5hZGtzaW0udjEuU3VibWl0RGVjaXNpb25SZXNwb25zZRJPCgxMaXN0U2Vzc2lvbnMSHi5hZGtzaW0udjEuTGlzdFNlc3Npb25zUmVxdWVzdBofLmFka3NpbS52MS5MaXN0U2Vzc2lvbnNSZXNwb25zZWIGcHJvdG8z',
+    'CiFhZGtzaW0vdjEvc2ltdWxhdG9yX3NlcnZpY2UucHJvdG8SCWFka3NpbS52MSIrChRDcmVhdGVTZXNzaW9uUmVxdWVzdBITCgtkZXNjcmlwdGlvbhgBIAEoCSJFChVDcmVhdGVTZXNzaW9uUmVzcG9uc2USLAoHc2Vzc2lvbhgBIAEoCzIbLmFka3NpbS52MS5TaW11bGF0b3JTZXNzaW9uIlAKEFN1YnNjcmliZVJlcXVlc3QSEgoKc2Vzc2lvbl9pZBgBIAEoCRIRCgljbGllbnRfaWQYAiABKAkSFQoNbGFzdF9ldmVudF9pZBgDIAEoCSI7ChFTdWJzY3JpYmVSZXNwb25zZRImCgVldmVudBgBIAEoCzIXLmFka3NpbS52MS5TZXNzaW9uRXZlbnQinQEKFFN1Ym1pdFJlcXVlc3RSZXF1ZXN0EhIKCnNlc3Npb25faWQYASABKAkSDwoHdHVybl9pZBgCIAEoCRISCgphZ2VudF9uYW1lGAMgASgJEkwKB3JlcXVlc3QYBCABKAsyOy5nb29nbGUuYWkuZ2VuZXJhdGl2ZWxhbmd1YWdlLnYxYmV0YS5HZW5lcmF0ZUNvbnRlbnRSZXF1ZXN0IikKFVN1Ym1pdFJlcXVlc3RSZXNwb25zZRIQCghldmVudF9pZBgBIAEoCSKMAQoVU3VibWl0RGVjaXNpb25SZXF1ZXN0EhIKCnNlc3Npb25faWQYASABKAkSDwoHdHVybl9pZBgCIAEoCRJOCghyZXNwb25zZRgDIAEoCzI8Lmdvb2dsZS5haS5nZW5lcmF0aXZlbGFuZ3VhZ2UudjFiZXRhLkdlbmVyYXRlQ29udGVudFJlc3BvbnNlIioKFlN1Ym1pdERlY2lzaW9uUmVzcG9uc2USEAoIZXZlbnRfaWQYASABKAkiPAoTTGlzdFNlc3Npb25zUmVxdWVzdBIRCglwYWdlX3NpemUYASABKAUSEgoKcGFnZV90b2tlbhgCIAEoCSJeChRMaXN0U2Vzc2lvbnNSZXNwb25zZRItCghzZXNzaW9ucxgBIAMoCzIbLmFka3NpbS52MS5TaW11bGF0b3JTZXNzaW9uEhcKD25leHRfcGFnZV90b2tlbhgCIAEoCTKsAwoQU2ltdWxhdG9yU2VydmljZRJSCg1DcmVhdGVTZXNzaW9uEh8uYWRrc2ltLnYxLkNyZWF0ZVNlc3Npb25SZXF1ZXN0GiAuYWRrc2ltLnYxLkNyZWF0ZVNlc3Npb25SZXNwb25zZRJICglTdWJzY3JpYmUSGy5hZGtzaW0udjEuU3Vic2NyaWJlUmVxdWVzdBocLmFka3NpbS52MS5TdWJzY3JpYmVSZXNwb25zZTABElIKDVN1Ym1pdFJlcXVlc3QSHy5hZGtzaW0udjEuU3VibWl0UmVxdWVzdFJlcXVlc3QaIC5hZGtzaW0udjEuU3VibWl0UmVxdWVzdFJlc3BvbnNlElUKDlN1Ym1pdERlY2lzaW9uEiAuYWRrc2ltLnYxLlN1Ym1pdERlY2lzaW9uUmVxdWVzdBohLmFka3NpbS52MS5TdWJtaXREZWNpc2lvblJlc3BvbnNlEk8KDExpc3RTZXNzaW9ucxIeLmFka3NpbS52MS5MaXN0U2Vzc2lvbnNSZXF1ZXN0Gh8uYWRrc2ltLnYxLkxpc3RTZXNzaW9uc1Jlc3BvbnNlYgZwcm90bzM',
     [file_adksim_v1_simulator_session, file_google_ai_generativelanguage_v1beta_generative_service],
   );
 
@@ -86,6 +86,14 @@ export type SubscribeRequest = Message<'adksim.v1.SubscribeRequest'> & {
    * @generated from field: string client_id = 2;
    */
   clientId: string;
+
+  /**
+   * Resume after this event: history up to and including it is not replayed.
+   * Empty (or unknown to the server) replays the full session history.
+   *
+   * @generated from field: string last_event_id = 3;
+   */
+  lastEventId: string;
 };
 
 /**
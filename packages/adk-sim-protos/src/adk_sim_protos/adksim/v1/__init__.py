@@ -138,6 +138,12 @@ class SubscribeRequest(betterproto.Message):
   client_id: str = betterproto.string_field(2)
   """Client identifier for debug/logging purposes (UUID)."""
 
+  last_event_id: str = betterproto.string_field(3)
+  """
+  Resume after this event: history up to and including it is not replayed.
+   Empty (or unknown to the server) replays the full session history.
+  """
+
 
 @dataclass(eq=False, repr=False)
 class SubscribeResponse(betterproto.Message):
@@ -1,16 +1,38 @@
 """ADK Simulator Testing Utilities.
 
 Provides test fixtures, fakes, and helpers for testing ADK Simulator components.
+
+Public names are imported on first access, so importing one submodule (e.g.
+``adk_sim_testing.fixtures``) does not also load the ADK-heavy helpers.
 """
 
-from adk_sim_testing.fixtures import FakeEventRepository, FakeSessionRepository
-from adk_sim_testing.helpers import (
-  FakeLlm,
-  build_invocation_context,
-  run_agent_with_fake,
-)
-from adk_sim_testing.proto_helpers import make_text_response, make_tool_call_response
-from adk_sim_testing.simulated_human import SimulatedHuman
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+  from adk_sim_testing.fixtures import FakeEventRepository, FakeSessionRepository
+  from adk_sim_testing.helpers import (
+    FakeLlm,
+    build_invocation_context,
+    run_agent_with_fake,
+  )
+  from adk_sim_testing.proto_helpers import (
+    make_text_response,
+    make_tool_call_response,
+  )
+  from adk_sim_testing.simulated_human import SimulatedHuman
+
+# Public name -> module that defines it
+_LAZY_IMPORTS: dict[str, str] = {
+  "FakeEventRepository": "adk_sim_testing.fixtures",
+  "FakeSessionRepository": "adk_sim_testing.fixtures",
+  "FakeLlm": "adk_sim_testing.helpers",
+  "build_invocation_context": "adk_sim_testing.helpers",
+  "run_agent_with_fake": "adk_sim_testing.helpers",
+  "make_text_response": "adk_sim_testing.proto_helpers",
+  "make_tool_call_response": "adk_sim_testing.proto_helpers",
+  "SimulatedHuman": "adk_sim_testing.simulated_human",
+}
 
 __all__ = [
   "FakeEventRepository",
@@ -22,3 +44,14 @@ __all__ = [
   "make_tool_call_response",
   "run_agent_with_fake",
 ]
+
+
+def __getattr__(name: str) -> Any:
+  """Import a public name on first access and cache it on the module."""
+  module_name = _LAZY_IMPORTS.get(name)
+  if module_name is None:
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+  value = getattr(importlib.import_module(module_name), name)
+  globals()[name] = value
+  return value
@@ -1,10 +1,11 @@
 """Test fixtures package.
 
-Provides fake implementations of repositories for unit testing.
+Provides fake implementations of repositories and services for unit testing.
 These fakes are preferred over mocks per the project testing constitution.
 """
 
 from adk_sim_testing.fixtures.fake_event_repo import FakeEventRepository
 from adk_sim_testing.fixtures.fake_session_repo import FakeSessionRepository
+from adk_sim_testing.fixtures.fake_simulator_service import FakeSimulatorService
 
-__all__ = ["FakeEventRepository", "FakeSessionRepository"]
+__all__ = ["FakeEventRepository", "FakeSessionRepository", "FakeSimulatorService"]
@@ -0,0 +1,71 @@
+"""Fake SimulatorService for unit testing.
+
+Provides an in-memory stand-in for the SimulatorService unary methods, for
+exercising the gRPC-Web gateway without a session manager, request queue,
+or database behind it.
+"""
+
+import betterproto
+from adk_sim_protos.adksim.v1 import (
+  CreateSessionRequest,
+  CreateSessionResponse,
+  ListSessionsRequest,
+  ListSessionsResponse,
+  SubmitDecisionRequest,
+  SubmitDecisionResponse,
+  SubmitRequestRequest,
+  SubmitRequestResponse,
+)
+
+
+class FakeSimulatorService:
+  """In-memory fake of SimulatorService's unary methods for unit testing.
+
+  Each method records the request it received and returns an empty
+  response, or raises the configured error instead.
+
+  Example:
+      service = FakeSimulatorService(error=GRPCError(Status.NOT_FOUND))
+      app = create_app(cast("SimulatorService", service))
+  """
+
+  def __init__(self, error: Exception | None = None) -> None:
+    """Initialize with an optional error for every method to raise.
+
+    Args:
+        error: Exception raised by each method instead of responding.
+    """
+    self.error = error
+    self.requests: list[betterproto.Message] = []
+
+  def _record(self, request: betterproto.Message) -> None:
+    """Record a request, then raise the configured error if there is one."""
+    self.requests.append(request)
+    if self.error is not None:
+      raise self.error
+
+  async def create_session(
+    self, request: CreateSessionRequest
+  ) -> CreateSessionResponse:
+    """Record the request and return an empty response."""
+    self._record(request)
+    return CreateSessionResponse()
+
+  async def list_sessions(self, request: ListSessionsRequest) -> ListSessionsResponse:
+    """Record the request and return an empty response."""
+    self._record(request)
+    return ListSessionsResponse()
+
+  async def submit_request(
+    self, request: SubmitRequestRequest
+  ) -> SubmitRequestResponse:
+    """Record the request and return an empty response."""
+    self._record(request)
+    return SubmitRequestResponse()
+
+  async def submit_decision(
+    self, request: SubmitDecisionRequest
+  ) -> SubmitDecisionResponse:
+    """Record the request and return an empty response."""
+    self._record(request)
+    return SubmitDecisionResponse()
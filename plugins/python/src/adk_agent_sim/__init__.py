@@ -3,12 +3,26 @@
 This package provides tools for human-in-the-loop validation of ADK agent workflows.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 # Apply betterproto Struct patch early - MUST be before any Struct usage
 # See adk_sim_protos_patch for details on why this is necessary
 from adk_sim_protos_patch import apply_struct_patch
 
 _ = apply_struct_patch  # Patch is auto-applied on import
 
-from adk_agent_sim.plugin.core import SimulatorPlugin  # noqa: E402
+if TYPE_CHECKING:
+  from adk_agent_sim.plugin.core import SimulatorPlugin
 
 __all__ = ["SimulatorPlugin"]
+
+
+def __getattr__(name: str) -> Any:
+  """Import SimulatorPlugin on first access (see adk_agent_sim.plugin)."""
+  if name != "SimulatorPlugin":
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+  value = importlib.import_module("adk_agent_sim.plugin.core").SimulatorPlugin
+  globals()[name] = value
+  return value
@@ -4,6 +4,24 @@ This package provides the SimulatorPlugin class that integrates with the ADK
 framework to intercept LLM calls and route them through the Remote Brain protocol.
 """
 
-from adk_agent_sim.plugin.core import SimulatorPlugin
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+  from adk_agent_sim.plugin.core import SimulatorPlugin
 
 __all__ = ["SimulatorPlugin"]
+
+
+def __getattr__(name: str) -> Any:
+  """Import SimulatorPlugin on first access.
+
+  Keeps imports of sibling modules (config, converter, futures) from
+  loading the plugin core and its ADK/gRPC dependencies.
+  """
+  if name != "SimulatorPlugin":
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+  value = importlib.import_module("adk_agent_sim.plugin.core").SimulatorPlugin
+  globals()[name] = value
+  return value
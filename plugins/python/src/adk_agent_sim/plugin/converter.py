@@ -26,6 +26,23 @@ from google.adk.models.llm_request import LlmRequest
 from google.adk.models.llm_response import LlmResponse
 from google.genai import types as genai_types
 
+# genai -> betterproto enum translations, built once at import. genai prefixes
+# category names with HARM_CATEGORY_; threshold names match exactly. genai
+# members with no proto counterpart are left out, so lookups return None.
+_HARM_CATEGORY_TO_PROTO: dict[genai_types.HarmCategory, glm.HarmCategory] = {
+  category: glm.HarmCategory[name]
+  for category in genai_types.HarmCategory
+  if (name := category.name.removeprefix("HARM_CATEGORY_"))
+  in glm.HarmCategory.__members__
+}
+_HARM_BLOCK_THRESHOLD_TO_PROTO: dict[
+  genai_types.HarmBlockThreshold, glm.SafetySettingHarmBlockThreshold
+] = {
+  threshold: glm.SafetySettingHarmBlockThreshold[threshold.name]
+  for threshold in genai_types.HarmBlockThreshold
+  if threshold.name in glm.SafetySettingHarmBlockThreshold.__members__
+}
+
 
 class ADKProtoConverter:
   """Handles conversion between ADK/Pydantic objects and betterproto messages.
@@ -245,6 +262,9 @@ def _convert_safety_settings(
   - genai: HARM_CATEGORY_DANGEROUS_CONTENT -> betterproto: DANGEROUS_CONTENT
   - Threshold names are the same
 
+  Both mappings are precomputed module-level dicts, so each setting costs
+  two dict lookups.
+
   Args:
       safety_settings: List of google.genai.types.SafetySetting Pydantic objects.
 
@@ -256,32 +276,22 @@ def _convert_safety_settings(
 
   result: list[glm.SafetySetting] = []
   for setting in safety_settings:
-    setting_dict = setting.model_dump(mode="json", exclude_none=True)
-
-    # Map category enum name (remove HARM_CATEGORY_ prefix if present)
-    category_str = setting_dict.get("category", "")
-    if category_str.startswith("HARM_CATEGORY_"):
-      category_str = category_str.replace("HARM_CATEGORY_", "")
-
-    # Map threshold enum name
-    threshold_str = setting_dict.get("threshold", "")
-
-    try:
-      if category_str:
-        category = glm.HarmCategory[category_str]
-      else:
-        category = glm.HarmCategory.UNSPECIFIED
-
-      if threshold_str:
-        threshold = glm.SafetySettingHarmBlockThreshold[threshold_str]
-      else:
-        threshold = glm.SafetySettingHarmBlockThreshold.HARM_BLOCK_THRESHOLD_UNSPECIFIED
-
-      result.append(glm.SafetySetting(category=category, threshold=threshold))
-    except KeyError:
-      # Skip settings with unknown enum values
+    if setting.category is None:
+      category = glm.HarmCategory.UNSPECIFIED
+    else:
+      category = _HARM_CATEGORY_TO_PROTO.get(setting.category)
+
+    if setting.threshold is None:
+      threshold = glm.SafetySettingHarmBlockThreshold.HARM_BLOCK_THRESHOLD_UNSPECIFIED
+    else:
+      threshold = _HARM_BLOCK_THRESHOLD_TO_PROTO.get(setting.threshold)
+
+    # Skip settings with unknown enum values
+    if category is None or threshold is None:
       continue
 
+    result.append(glm.SafetySetting(category=category, threshold=threshold))
+
   return result
 
 
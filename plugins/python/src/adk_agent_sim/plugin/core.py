@@ -20,7 +20,9 @@ import asyncio
 import contextlib
 import logging
 import os
+import random
 import sys
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 from uuid import uuid4
@@ -63,14 +65,14 @@ class SimulatorPlugin(BasePlugin):
 
   Attributes:
       server_url: The gRPC server address (host:port).
-      target_agents: Set of agent names to intercept. If empty, intercepts all.
+      target_agents: Frozen set of agent names to intercept. If empty, intercepts all.
       session_id: The current session ID (set after initialization).
   """
 
   def __init__(
     self,
     server_url: str | None = None,
-    target_agents: set[str] | None = None,
+    target_agents: Iterable[str] | None = None,
     name: str = "adk_simulator",
   ) -> None:
     """Initialize the SimulatorPlugin.
@@ -78,9 +80,10 @@ class SimulatorPlugin(BasePlugin):
     Args:
         server_url: The Simulator Server address. Defaults to ADK_SIM_SERVER env var
                    or "localhost:50051".
-        target_agents: Optional set of agent names to intercept. If None or empty,
+        target_agents: Optional agent names to intercept. If None or empty,
                       all agents are intercepted. Can also be set via ADK_SIM_TARGETS
-                      environment variable (comma-separated).
+                      environment variable (comma-separated). Stored as a frozenset,
+                      so later changes to the caller's collection have no effect.
         name: The unique name for this plugin instance. Defaults to "adk_simulator".
     """
     super().__init__(name=name)
@@ -90,13 +93,13 @@ class SimulatorPlugin(BasePlugin):
     if target_agents is None:
       targets_env = os.environ.get("ADK_SIM_TARGETS", "")
       if targets_env:
-        self.target_agents: set[str] = {
+        self.target_agents: frozenset[str] = frozenset(
           name.strip() for name in targets_env.split(",") if name.strip()
-        }
+        )
       else:
-        self.target_agents = set()
+        self.target_agents = frozenset()
     else:
-      self.target_agents = target_agents
+      self.target_agents = frozenset(target_agents)
 
     self.session_id: str | None = None
     self._pending_futures = PendingFutureRegistry()
@@ -104,11 +107,14 @@ class SimulatorPlugin(BasePlugin):
     self._factory: SimulatorClientFactory | None = None
     self._stub: SimulatorServiceStub | None = None
     self._shutting_down = False
+    # Last event received, so a resubscribe only replays what came after it
+    self._last_event_id = ""
 
     # Reconnection settings
     self._initial_backoff = 1.0  # seconds
     self._max_backoff = 30.0  # seconds
     self._backoff_multiplier = 2.0
+    self._backoff_jitter = 0.2  # fraction of the delay, applied both ways
 
   def should_intercept(self, agent_name: str) -> bool:
     """Check if a given agent should be intercepted.
@@ -283,8 +289,10 @@ class SimulatorPlugin(BasePlugin):
     - llm_response events: Resolved via PendingFutureRegistry if pending
     - Unknown events: Logged and ignored
 
-    On connection loss (gRPC exceptions), implements exponential backoff
-    reconnection using the stored session_id.
+    On connection loss (gRPC exceptions), implements jittered exponential
+    backoff reconnection using the stored session_id. The delay resets once
+    the new stream delivers an event. Resubscribes pass the last received
+    event_id so the server skips history this plugin has already seen.
 
     Idempotency is handled by PendingFutureRegistry.resolve() which
     returns False for already-resolved or unknown turn_ids (T051).
@@ -301,9 +309,13 @@ class SimulatorPlugin(BasePlugin):
           SubscribeRequest(
             session_id=self.session_id or "",
             client_id=str(uuid4()),
+            last_event_id=self._last_event_id,
           )
         ):
           event = response.event
+          # Markers such as history_complete carry no event_id
+          if event.event_id:
+            self._last_event_id = event.event_id
           # Reset backoff on successful message
           backoff = self._initial_backoff
 
@@ -352,14 +364,16 @@ class SimulatorPlugin(BasePlugin):
           logger.debug("_listen_loop stopping due to shutdown")
           break
 
+        delay = self._jittered_backoff(backoff)
         logger.warning(
           "Connection lost: %s. Reconnecting in %.1fs...",
           type(e).__name__,
-          backoff,
+          delay,
         )
 
-        # T049: Exponential backoff
-        await asyncio.sleep(backoff)
+        # T049: Exponential backoff, jittered so that plugins dropped by the
+        # same server outage don't all reconnect at the same moment
+        await asyncio.sleep(delay)
         backoff = min(backoff * self._backoff_multiplier, self._max_backoff)
 
         # T050: Reconnect using stored session_id
@@ -370,6 +384,11 @@ class SimulatorPlugin(BasePlugin):
           logger.warning("Reconnection failed, will retry...")
           continue
 
+  def _jittered_backoff(self, backoff: float) -> float:
+    """Spread a backoff delay uniformly by up to ±_backoff_jitter of its length."""
+    spread = backoff * self._backoff_jitter
+    return backoff + random.uniform(-spread, spread)
+
   async def _reconnect(self) -> None:
     """Reconnect to the server using the stored session_id.
 
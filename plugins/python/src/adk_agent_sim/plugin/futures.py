@@ -20,6 +20,7 @@ Usage:
 """
 
 import asyncio
+from collections.abc import Iterable
 
 from adk_sim_protos.google.ai.generativelanguage.v1beta import (
   GenerateContentResponse,
@@ -70,6 +71,36 @@ class PendingFutureRegistry:
     self._pending[turn_id] = future
     return future
 
+  def create_many(
+    self, turn_ids: Iterable[str]
+  ) -> dict[str, asyncio.Future[GenerateContentResponse]]:
+    """Create and store Futures for several turn_ids at once.
+
+    Equivalent to calling create() for each turn_id, but looks up the event
+    loop once and merges the new futures into the registry in one update.
+    Nothing is registered if any turn_id is a duplicate.
+
+    Args:
+        turn_ids: Unique identifiers for the LLM request turns.
+
+    Returns:
+        A dict mapping each turn_id to its new Future, in input order.
+
+    Raises:
+        ValueError: If a future already exists for one of the turn_ids, or
+            the same turn_id appears more than once.
+    """
+    loop = asyncio.get_running_loop()
+    futures: dict[str, asyncio.Future[GenerateContentResponse]] = {}
+    for turn_id in turn_ids:
+      if turn_id in self._pending or turn_id in futures:
+        msg = f"Future already exists for turn_id: {turn_id}"
+        raise ValueError(msg)
+      futures[turn_id] = loop.create_future()
+
+    self._pending.update(futures)
+    return futures
+
   def resolve(self, turn_id: str, response: GenerateContentResponse) -> bool:
     """Resolve the Future for the given turn_id with the response.
 
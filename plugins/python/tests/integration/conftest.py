@@ -5,6 +5,7 @@ import pytest
 
 def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
   """Apply default timeout of 30 seconds to all integration tests."""
+  default_timeout = pytest.mark.timeout(30)
   for item in items:
     if not item.get_closest_marker("timeout"):
-      item.add_marker(pytest.mark.timeout(30))
+      item.add_marker(default_timeout)
@@ -12,68 +12,67 @@ from adk_agent_sim.plugin.converter import ADKProtoConverter
 from google.adk.models.llm_request import LlmRequest
 from google.adk.models.llm_response import LlmResponse
 from google.genai import types as genai_types
-from hamcrest import (
-  assert_that,
-  contains,
-  equal_to,
-  has_length,
-  has_properties,
-  instance_of,
-  not_none,
+
+# Request inputs shared across tests. The converter only reads them, so they
+# are built once per module rather than per test.
+_BASIC_CONTENTS = [
+  genai_types.Content(role="user", parts=[genai_types.Part(text="Hello")])
+]
+_EMPTY_CONFIG = genai_types.GenerateContentConfig()
+
+# The system_instruction formats exercised below, spelled out because
+# genai_types.ContentUnion includes members pyright cannot resolve
+_SystemInstruction = (
+  str | genai_types.Content | genai_types.Part | list[genai_types.Part]
 )
 
 
+def _part_texts(content: glm.Content | genai_types.Content | None) -> list[str | None]:
+  """Return the text of each part of a proto or genai Content."""
+  assert content is not None
+  return [part.text for part in content.parts or []]
+
+
 class TestLlmRequestToProto:
   """Tests for ADKProtoConverter.llm_request_to_proto()."""
 
   def test_basic_request_with_model_and_contents(self) -> None:
     """Test converting a simple request with model and contents."""
-    part = genai_types.Part(text="Hello")
-    contents = [genai_types.Content(role="user", parts=[part])]
     adk_request = LlmRequest(
       model="gemini-2.0-flash",
-      contents=contents,
-      config=genai_types.GenerateContentConfig(),
+      contents=_BASIC_CONTENTS,
+      config=_EMPTY_CONFIG,
     )
 
     proto_request = ADKProtoConverter.llm_request_to_proto(adk_request)
 
-    assert_that(
-      proto_request,
-      has_properties(
-        model="models/gemini-2.0-flash",
-        contents=contains(
-          has_properties(
-            role="user",
-            parts=contains(has_properties(text="Hello")),
-          )
-        ),
-      ),
-    )
+    assert proto_request.model == "models/gemini-2.0-flash"
+    assert [c.role for c in proto_request.contents] == ["user"]
+    assert _part_texts(proto_request.contents[0]) == ["Hello"]
 
   def test_model_name_already_prefixed(self) -> None:
     """Test that model names already prefixed with 'models/' are unchanged."""
     adk_request = LlmRequest(
       model="models/gemini-1.5-pro",
       contents=[],
-      config=genai_types.GenerateContentConfig(),
+      config=_EMPTY_CONFIG,
     )
 
     proto_request = ADKProtoConverter.llm_request_to_proto(adk_request)
 
-    assert_that(proto_request.model, equal_to("models/gemini-1.5-pro"))
+    assert proto_request.model == "models/gemini-1.5-pro"
 
   def test_empty_model_name(self) -> None:
     """Test handling of empty/None model name."""
     adk_request = LlmRequest(
       model=None,
       contents=[],
-      config=genai_types.GenerateContentConfig(),
+      config=_EMPTY_CONFIG,
     )
 
     proto_request = ADKProtoConverter.llm_request_to_proto(adk_request)
 
-    assert_that(proto_request.model, equal_to(""))
+    assert proto_request.model == ""
 
   def test_multiple_contents_and_parts(self) -> None:
     """Test converting multiple contents with multiple parts."""
@@ -93,105 +92,59 @@ class TestLlmRequestToProto:
     adk_request = LlmRequest(
       model="gemini-2.0-flash",
       contents=contents,
-      config=genai_types.GenerateContentConfig(),
+      config=_EMPTY_CONFIG,
     )
 
     proto_request = ADKProtoConverter.llm_request_to_proto(adk_request)
 
-    assert_that(
-      proto_request.contents,
-      contains(
-        has_properties(role="user", parts=has_length(2)),
-        has_properties(role="model"),
-      ),
-    )
+    assert [c.role for c in proto_request.contents] == ["user", "model"]
+    assert len(proto_request.contents[0].parts) == 2
 
-  def test_system_instruction_as_string(self) -> None:
-    """Test converting system instruction from string format."""
-    adk_request = LlmRequest(
-      model="gemini-2.0-flash",
-      contents=[],
-      config=genai_types.GenerateContentConfig(
-        system_instruction="You are a helpful assistant."
+  @pytest.mark.parametrize(
+    ("system_instruction", "expected_texts"),
+    [
+      pytest.param(
+        "You are a helpful assistant.",
+        ["You are a helpful assistant."],
+        id="string",
       ),
-    )
-
-    proto_request = ADKProtoConverter.llm_request_to_proto(adk_request)
-
-    assert_that(
-      proto_request.system_instruction,
-      has_properties(
-        parts=contains(has_properties(text="You are a helpful assistant."))
+      pytest.param(
+        genai_types.Content(
+          parts=[
+            genai_types.Part(text="System instruction line 1"),
+            genai_types.Part(text="System instruction line 2"),
+          ]
+        ),
+        ["System instruction line 1", "System instruction line 2"],
+        id="content",
       ),
-    )
-
-  def test_system_instruction_as_content(self) -> None:
-    """Test converting system instruction from Content format."""
-    system_content = genai_types.Content(
-      parts=[
-        genai_types.Part(text="System instruction line 1"),
-        genai_types.Part(text="System instruction line 2"),
-      ]
-    )
-    adk_request = LlmRequest(
-      model="gemini-2.0-flash",
-      contents=[],
-      config=genai_types.GenerateContentConfig(system_instruction=system_content),
-    )
-
-    proto_request = ADKProtoConverter.llm_request_to_proto(adk_request)
-
-    assert_that(
-      proto_request.system_instruction,
-      has_properties(
-        parts=contains(
-          has_properties(text="System instruction line 1"),
-          has_properties(text="System instruction line 2"),
-        )
+      pytest.param(
+        genai_types.Part(text="System as Part"),
+        ["System as Part"],
+        id="part",
       ),
-    )
-
-  def test_system_instruction_as_part(self) -> None:
-    """Test converting system instruction from single Part format."""
-    adk_request = LlmRequest(
-      model="gemini-2.0-flash",
-      contents=[],
-      config=genai_types.GenerateContentConfig(
-        system_instruction=genai_types.Part(text="System as Part")
+      pytest.param(
+        [genai_types.Part(text="Part A"), genai_types.Part(text="Part B")],
+        ["Part A", "Part B"],
+        id="part_list",
       ),
-    )
-
-    proto_request = ADKProtoConverter.llm_request_to_proto(adk_request)
-
-    assert_that(
-      proto_request.system_instruction,
-      has_properties(parts=contains(has_properties(text="System as Part"))),
-    )
-
-  def test_system_instruction_as_part_list(self) -> None:
-    """Test converting system instruction from list[Part] format."""
+    ],
+  )
+  def test_system_instruction_formats(
+    self,
+    system_instruction: _SystemInstruction,
+    expected_texts: list[str],
+  ) -> None:
+    """Test converting each supported system instruction format."""
     adk_request = LlmRequest(
       model="gemini-2.0-flash",
       contents=[],
-      config=genai_types.GenerateContentConfig(
-        system_instruction=[
-          genai_types.Part(text="Part A"),
-          genai_types.Part(text="Part B"),
-        ]
-      ),
+      config=genai_types.GenerateContentConfig(system_instruction=system_instruction),
     )
 
     proto_request = ADKProtoConverter.llm_request_to_proto(adk_request)
 
-    assert_that(
-      proto_request.system_instruction,
-      has_properties(
-        parts=contains(
-          has_properties(text="Part A"),
-          has_properties(text="Part B"),
-        )
-      ),
-    )
+    assert _part_texts(proto_request.system_instruction) == expected_texts
 
   def test_tools_conversion(self) -> None:
     """Test converting tools with function declarations."""
@@ -211,19 +164,11 @@ class TestLlmRequestToProto:
 
     proto_request = ADKProtoConverter.llm_request_to_proto(adk_request)
 
-    assert_that(
-      proto_request.tools,
-      contains(
-        has_properties(
-          function_declarations=contains(
-            has_properties(
-              name="get_weather",
-              description="Get the weather for a location",
-            )
-          )
-        )
-      ),
-    )
+    assert len(proto_request.tools) == 1
+    declarations = proto_request.tools[0].function_declarations
+    assert [(d.name, d.description) for d in declarations] == [
+      ("get_weather", "Get the weather for a location")
+    ]
 
   def test_safety_settings_conversion(self) -> None:
     """Test converting safety settings with enum mapping."""
@@ -239,15 +184,12 @@ class TestLlmRequestToProto:
 
     proto_request = ADKProtoConverter.llm_request_to_proto(adk_request)
 
-    assert_that(
-      proto_request.safety_settings,
-      contains(
-        has_properties(
-          category=glm.HarmCategory.DANGEROUS_CONTENT,
-          threshold=glm.SafetySettingHarmBlockThreshold.BLOCK_ONLY_HIGH,
-        )
-      ),
-    )
+    assert [(s.category, s.threshold) for s in proto_request.safety_settings] == [
+      (
+        glm.HarmCategory.DANGEROUS_CONTENT,
+        glm.SafetySettingHarmBlockThreshold.BLOCK_ONLY_HIGH,
+      )
+    ]
 
   def test_generation_config_conversion(self) -> None:
     """Test converting generation configuration parameters."""
@@ -270,42 +212,32 @@ class TestLlmRequestToProto:
 
     proto_request = ADKProtoConverter.llm_request_to_proto(adk_request)
 
-    assert_that(proto_request.generation_config, not_none())
     gen_config = proto_request.generation_config
-    assert_that(
-      gen_config,
-      has_properties(
-        temperature=equal_to(pytest.approx(0.7)),
-        top_p=equal_to(pytest.approx(0.9)),
-        top_k=40,
-        max_output_tokens=1000,
-        candidate_count=1,
-        stop_sequences=["STOP", "END"],
-        presence_penalty=equal_to(pytest.approx(0.5)),
-        frequency_penalty=equal_to(pytest.approx(0.5)),
-        seed=42,
-        response_mime_type="application/json",
-      ),
-    )
+    assert gen_config is not None
+    assert gen_config.temperature == pytest.approx(0.7)
+    assert gen_config.top_p == pytest.approx(0.9)
+    assert gen_config.top_k == 40
+    assert gen_config.max_output_tokens == 1000
+    assert gen_config.candidate_count == 1
+    assert gen_config.stop_sequences == ["STOP", "END"]
+    assert gen_config.presence_penalty == pytest.approx(0.5)
+    assert gen_config.frequency_penalty == pytest.approx(0.5)
+    assert gen_config.seed == 42
+    assert gen_config.response_mime_type == "application/json"
 
   def test_no_config(self) -> None:
     """Test handling request with no config."""
     adk_request = LlmRequest(
       model="gemini-2.0-flash",
-      contents=[genai_types.Content(role="user", parts=[genai_types.Part(text="Hi")])],
-      config=genai_types.GenerateContentConfig(),
+      contents=_BASIC_CONTENTS,
+      config=_EMPTY_CONFIG,
     )
 
     proto_request = ADKProtoConverter.llm_request_to_proto(adk_request)
 
     # Should still work, just with empty/default fields
-    assert_that(
-      proto_request,
-      has_properties(
-        model="models/gemini-2.0-flash",
-        contents=has_length(1),
-      ),
-    )
+    assert proto_request.model == "models/gemini-2.0-flash"
+    assert len(proto_request.contents) == 1
 
   def test_full_request_with_all_fields(self) -> None:
     """Integration test: full request with all supported fields."""
@@ -337,22 +269,17 @@ class TestLlmRequestToProto:
     proto_request = ADKProtoConverter.llm_request_to_proto(adk_request)
 
     # Verify all fields populated correctly
-    assert_that(
-      proto_request,
-      has_properties(
-        model="models/gemini-2.0-flash",
-        contents=has_length(1),
-        system_instruction=has_properties(
-          parts=contains(has_properties(text="You are a math assistant."))
-        ),
-        tools=has_length(1),
-        safety_settings=has_length(1),
-        generation_config=has_properties(
-          temperature=equal_to(pytest.approx(0.5)),
-          max_output_tokens=500,
-        ),
-      ),
-    )
+    assert proto_request.model == "models/gemini-2.0-flash"
+    assert len(proto_request.contents) == 1
+    assert _part_texts(proto_request.system_instruction) == [
+      "You are a math assistant."
+    ]
+    assert len(proto_request.tools) == 1
+    assert len(proto_request.safety_settings) == 1
+    gen_config = proto_request.generation_config
+    assert gen_config is not None
+    assert gen_config.temperature == pytest.approx(0.5)
+    assert gen_config.max_output_tokens == 500
 
 
 class TestProtoToLlmResponse:
@@ -376,18 +303,12 @@ class TestProtoToLlmResponse:
 
     llm_response = ADKProtoConverter.proto_to_llm_response(proto_response)
 
-    assert_that(llm_response, instance_of(LlmResponse))
-    assert_that(
-      llm_response,
-      has_properties(
-        content=has_properties(
-          role="model",
-          parts=contains(has_properties(text="Hello! How can I help?")),
-        ),
-        model_version="gemini-2.0-flash",
-        finish_reason=genai_types.FinishReason.STOP,
-      ),
-    )
+    assert isinstance(llm_response, LlmResponse)
+    assert llm_response.content is not None
+    assert llm_response.content.role == "model"
+    assert _part_texts(llm_response.content) == ["Hello! How can I help?"]
+    assert llm_response.model_version == "gemini-2.0-flash"
+    assert llm_response.finish_reason == genai_types.FinishReason.STOP
 
   def test_response_with_multiple_parts(self) -> None:
     """Test converting response with multiple parts."""
@@ -408,15 +329,7 @@ class TestProtoToLlmResponse:
 
     llm_response = ADKProtoConverter.proto_to_llm_response(proto_response)
 
-    assert_that(
-      llm_response.content,
-      has_properties(
-        parts=contains(
-          has_properties(text="Part 1"),
-          has_properties(text="Part 2"),
-        )
-      ),
-    )
+    assert _part_texts(llm_response.content) == ["Part 1", "Part 2"]
 
   def test_response_with_function_call(self) -> None:
     """Test converting response containing a function call.
@@ -445,12 +358,11 @@ class TestProtoToLlmResponse:
 
     llm_response = ADKProtoConverter.proto_to_llm_response(proto_response)
 
-    assert_that(
-      llm_response.content,
-      has_properties(
-        parts=contains(has_properties(function_call=has_properties(name="get_weather")))
-      ),
-    )
+    assert llm_response.content is not None
+    parts = llm_response.content.parts or []
+    assert [p.function_call.name if p.function_call else None for p in parts] == [
+      "get_weather"
+    ]
 
   def test_response_with_usage_metadata(self) -> None:
     """Test converting response with usage metadata."""
@@ -473,14 +385,11 @@ class TestProtoToLlmResponse:
 
     llm_response = ADKProtoConverter.proto_to_llm_response(proto_response)
 
-    assert_that(
-      llm_response.usage_metadata,
-      has_properties(
-        prompt_token_count=10,
-        candidates_token_count=20,
-        total_token_count=30,
-      ),
-    )
+    usage = llm_response.usage_metadata
+    assert usage is not None
+    assert usage.prompt_token_count == 10
+    assert usage.candidates_token_count == 20
+    assert usage.total_token_count == 30
 
   def test_response_with_max_tokens_finish_reason(self) -> None:
     """Test converting response that hit max tokens limit."""
@@ -498,9 +407,7 @@ class TestProtoToLlmResponse:
 
     llm_response = ADKProtoConverter.proto_to_llm_response(proto_response)
 
-    assert_that(
-      llm_response.finish_reason, equal_to(genai_types.FinishReason.MAX_TOKENS)
-    )
+    assert llm_response.finish_reason == genai_types.FinishReason.MAX_TOKENS
 
   def test_empty_response(self) -> None:
     """Test converting empty response (no candidates)."""
@@ -509,8 +416,8 @@ class TestProtoToLlmResponse:
     llm_response = ADKProtoConverter.proto_to_llm_response(proto_response)
 
     # Empty response should still be valid
-    assert_that(llm_response, instance_of(LlmResponse))
-    assert_that(llm_response.content, equal_to(None))
+    assert isinstance(llm_response, LlmResponse)
+    assert llm_response.content is None
 
 
 class TestRoundTrip:
@@ -534,18 +441,10 @@ class TestRoundTrip:
     proto_request = ADKProtoConverter.llm_request_to_proto(adk_request)
 
     # Verify key data preserved
-    assert_that(
-      proto_request,
-      has_properties(
-        contents=contains(
-          has_properties(parts=contains(has_properties(text=original_text)))
-        ),
-        system_instruction=has_properties(
-          parts=contains(has_properties(text="Be philosophical."))
-        ),
-        generation_config=has_properties(temperature=equal_to(pytest.approx(0.8))),
-      ),
-    )
+    assert [_part_texts(c) for c in proto_request.contents] == [[original_text]]
+    assert _part_texts(proto_request.system_instruction) == ["Be philosophical."]
+    assert proto_request.generation_config is not None
+    assert proto_request.generation_config.temperature == pytest.approx(0.8)
 
   def test_response_text_property_works(self) -> None:
     """Test that converted response supports ADK's .text property."""
@@ -567,9 +466,7 @@ class TestRoundTrip:
     llm_response = ADKProtoConverter.proto_to_llm_response(proto_response)
 
     # LlmResponse.content is a Content object, which should have parts
-    assert_that(llm_response.content, not_none())
-    assert llm_response.content is not None  # type narrowing for pyright
-    assert_that(llm_response.content.parts, not_none())
-    assert llm_response.content.parts is not None  # type narrowing for pyright
+    assert llm_response.content is not None
+    assert llm_response.content.parts is not None
     combined_text = "".join(p.text for p in llm_response.content.parts if p.text)
-    assert_that(combined_text, equal_to("Part A Part B"))
+    assert combined_text == "Part A Part B"
@@ -13,15 +13,31 @@ from adk_sim_protos.google.ai.generativelanguage.v1beta import (
 from hamcrest import assert_that, equal_to, instance_of, is_
 
 
+def _make_response(text: str) -> GenerateContentResponse:
+  """Build a single-candidate text response."""
+  return GenerateContentResponse(
+    candidates=[Candidate(content=Content(parts=[Part(text=text)]))]
+  )
+
+
+# Responses for test_concurrent_requests; built once, never mutated
+_CONCURRENT_RESPONSES = {
+  f"turn-{i}": _make_response(f"Response {i}") for i in (1, 2, 3)
+}
+
+
 @pytest.fixture
 def registry() -> PendingFutureRegistry:
   """Create a PendingFutureRegistry for testing."""
   return PendingFutureRegistry()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_response() -> GenerateContentResponse:
-  """Create a sample GenerateContentResponse for testing."""
+  """Create a sample GenerateContentResponse for testing.
+
+  Session-scoped: tests only pass it through the registry and compare it.
+  """
   return GenerateContentResponse(
     candidates=[
       Candidate(
@@ -71,6 +87,32 @@ class TestPendingFutureRegistryCreate:
       registry.create("turn-123")
 
 
+class TestPendingFutureRegistryCreateMany:
+  """Tests for PendingFutureRegistry.create_many()."""
+
+  async def test_create_many_stores_futures(
+    self, registry: PendingFutureRegistry
+  ) -> None:
+    """create_many() stores one future per turn_id, keyed in input order."""
+    futures = registry.create_many(["turn-1", "turn-2", "turn-3"])
+
+    assert_that(list(futures), equal_to(["turn-1", "turn-2", "turn-3"]))
+    assert_that(len(registry), equal_to(3))
+    assert_that(registry.has_pending("turn-2"), is_(True))
+
+  async def test_create_many_duplicate_registers_nothing(
+    self, registry: PendingFutureRegistry
+  ) -> None:
+    """create_many() raises on a duplicate without registering any future."""
+    registry.create("turn-2")
+
+    with pytest.raises(ValueError, match="Future already exists for turn_id"):
+      registry.create_many(["turn-1", "turn-2"])
+
+    assert_that(len(registry), equal_to(1))
+    assert_that(registry.has_pending("turn-1"), is_(False))
+
+
 class TestPendingFutureRegistryResolve:
   """Tests for PendingFutureRegistry.resolve()."""
 
@@ -153,25 +195,16 @@ class TestPendingFutureRegistryCancelAll:
 
     assert_that(len(registry), equal_to(0))
 
+  @pytest.mark.parametrize("pending", [0, 3])
   async def test_cancel_all_returns_count(
-    self, registry: PendingFutureRegistry
+    self, registry: PendingFutureRegistry, pending: int
   ) -> None:
-    """cancel_all() returns the number of cancelled futures."""
-    registry.create("turn-1")
-    registry.create("turn-2")
-    registry.create("turn-3")
+    """cancel_all() returns the number of cancelled futures (0 when empty)."""
+    registry.create_many(f"turn-{i}" for i in range(pending))
 
     count = registry.cancel_all()
 
-    assert_that(count, equal_to(3))
-
-  async def test_cancel_all_returns_zero_for_empty_registry(
-    self, registry: PendingFutureRegistry
-  ) -> None:
-    """cancel_all() returns 0 for empty registry."""
-    count = registry.cancel_all()
-
-    assert_that(count, equal_to(0))
+    assert_that(count, equal_to(pending))
 
   async def test_cancel_all_does_not_cancel_already_done_futures(
     self, registry: PendingFutureRegistry, sample_response: GenerateContentResponse
@@ -201,13 +234,14 @@ class TestPendingFutureRegistryIntegration:
     # Simulate the request path creating a future
     future = registry.create("turn-abc")
 
-    # Simulate the listen loop resolving the future
-    async def resolve_after_delay() -> None:
-      await asyncio.sleep(0.01)
+    # Simulate the listen loop resolving the future. Yielding one loop tick
+    # is enough to make the resolver run after the awaiter has suspended.
+    async def resolve_on_next_tick() -> None:
+      await asyncio.sleep(0)
       registry.resolve("turn-abc", sample_response)
 
     # Start the resolver task
-    resolver_task = asyncio.create_task(resolve_after_delay())
+    resolver_task = asyncio.create_task(resolve_on_next_tick())
 
     # Await the future (this would block in real code)
     result = await future
@@ -220,30 +254,12 @@ class TestPendingFutureRegistryIntegration:
   async def test_concurrent_requests(self, registry: PendingFutureRegistry) -> None:
     """Test handling multiple concurrent requests."""
     # Create multiple pending requests
-    future1 = registry.create("turn-1")
-    future2 = registry.create("turn-2")
-    future3 = registry.create("turn-3")
-
-    response1 = GenerateContentResponse(
-      candidates=[Candidate(content=Content(parts=[Part(text="Response 1")]))]
-    )
-    response2 = GenerateContentResponse(
-      candidates=[Candidate(content=Content(parts=[Part(text="Response 2")]))]
-    )
-    response3 = GenerateContentResponse(
-      candidates=[Candidate(content=Content(parts=[Part(text="Response 3")]))]
-    )
+    futures = registry.create_many(_CONCURRENT_RESPONSES)
 
     # Resolve out of order
-    registry.resolve("turn-2", response2)
-    registry.resolve("turn-1", response1)
-    registry.resolve("turn-3", response3)
+    for turn_id in ("turn-2", "turn-1", "turn-3"):
+      registry.resolve(turn_id, _CONCURRENT_RESPONSES[turn_id])
 
     # All futures should have correct results
-    result1 = await future1
-    result2 = await future2
-    result3 = await future3
-
-    assert_that(result1, equal_to(response1))
-    assert_that(result2, equal_to(response2))
-    assert_that(result3, equal_to(response3))
+    for turn_id, future in futures.items():
+      assert_that(await future, equal_to(_CONCURRENT_RESPONSES[turn_id]))
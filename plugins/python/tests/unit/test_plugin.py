@@ -2,14 +2,15 @@
 
 import asyncio
 import contextlib
-import io
-import sys
-from collections.abc import AsyncIterator
+import copy
+from collections.abc import AsyncIterator, Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 
 import pytest
 from adk_agent_sim.plugin import SimulatorPlugin
+from adk_agent_sim.plugin import core as core_module
+from adk_agent_sim.plugin.config import PluginConfig
 from adk_sim_protos.adksim.v1 import (
   CreateSessionRequest,
   CreateSessionResponse,
@@ -27,12 +28,19 @@ from adk_sim_protos.google.ai.generativelanguage.v1beta import (
   GenerateContentResponse,
   Part,
 )
-from hamcrest import (
-  assert_that,
-  contains_string,
-  equal_to,
-  is_,
-)
+from google.adk.models.llm_request import LlmRequest
+from google.genai import types as genai_types
+from grpclib.const import Status
+from grpclib.exceptions import GRPCError, StreamTerminatedError
+
+# Top and bottom border of the session banner printed by initialize()
+_BANNER_SEP = "=" * 64
+
+# Timestamp for fake events and sessions; the plugin never inspects it
+_FIXED_TS = datetime(2024, 1, 1, tzinfo=UTC)
+
+# Default request config; the plugin only reads it, so tests can share one
+_EMPTY_CONFIG = genai_types.GenerateContentConfig()
 
 
 class TestSimulatorPlugin:
@@ -42,7 +50,7 @@ class TestSimulatorPlugin:
     """Test that SimulatorPlugin uses default values."""
     plugin = SimulatorPlugin()
     assert plugin.server_url == "localhost:50051"
-    assert plugin.target_agents == set()
+    assert plugin.target_agents == frozenset()
     assert plugin.session_id is None
 
   def test_plugin_initialization_custom_url(self) -> None:
@@ -52,8 +60,8 @@ class TestSimulatorPlugin:
 
   def test_plugin_initialization_target_agents(self) -> None:
     """Test that SimulatorPlugin accepts target agents."""
-    plugin = SimulatorPlugin(target_agents={"agent1", "agent2"})
-    assert plugin.target_agents == {"agent1", "agent2"}
+    plugin = SimulatorPlugin(target_agents=frozenset({"agent1", "agent2"}))
+    assert plugin.target_agents == frozenset({"agent1", "agent2"})
 
   def test_should_intercept_all_when_no_targets(self) -> None:
     """Test that all agents are intercepted when no targets specified."""
@@ -63,13 +71,13 @@ class TestSimulatorPlugin:
 
   def test_should_intercept_only_targets(self) -> None:
     """Test that only target agents are intercepted."""
-    plugin = SimulatorPlugin(target_agents={"orchestrator", "router"})
+    plugin = SimulatorPlugin(target_agents=frozenset({"orchestrator", "router"}))
     assert plugin.should_intercept("orchestrator") is True
     assert plugin.should_intercept("router") is True
     assert plugin.should_intercept("other_agent") is False
 
 
-@dataclass
+@dataclass(slots=True)
 class FakeSimulatorServiceStub:
   """Fake SimulatorServiceStub for testing _listen_loop without real gRPC.
 
@@ -79,6 +87,11 @@ class FakeSimulatorServiceStub:
 
   events: list[SessionEvent]
   error_after: int | None = None
+  _responses: list[SubscribeResponse] = field(init=False, repr=False)
+
+  def __post_init__(self) -> None:
+    """Wrap the configured events once, so each subscribe() just replays them."""
+    self._responses = [SubscribeResponse(event=event) for event in self.events]
 
   async def subscribe(
     self, request: SubscribeRequest
@@ -94,13 +107,15 @@ class FakeSimulatorServiceStub:
     Raises:
         RuntimeError: If error_after is set and that many events have been yielded.
     """
-    for i, event in enumerate(self.events):
+    if self.error_after == 0:
+      raise RuntimeError("Simulated connection error")
+    for i, response in enumerate(self._responses):
       if self.error_after is not None and i >= self.error_after:
         raise RuntimeError("Simulated connection error")
-      yield SubscribeResponse(event=event)
+      yield response
 
 
-@dataclass
+@dataclass(slots=True)
 class FakeInitializingStub:
   """Fake SimulatorServiceStub for testing initialize() flow.
 
@@ -124,7 +139,7 @@ class FakeInitializingStub:
     return CreateSessionResponse(
       session=SimulatorSession(
         id=self.session_id,
-        created_at=datetime.now(UTC),
+        created_at=_FIXED_TS,
         description=self.description,
       )
     )
@@ -137,7 +152,7 @@ class FakeInitializingStub:
       yield SubscribeResponse(event=event)
 
 
-@dataclass
+@dataclass(slots=True)
 class FakeInitializingFactory:
   """Fake SimulatorClientFactory for testing initialize() flow.
 
@@ -163,12 +178,13 @@ def _create_llm_request_event(
   turn_id: str,
   event_id: str = "event-001",
   session_id: str = "session-001",
+  timestamp: datetime = _FIXED_TS,
 ) -> SessionEvent:
   """Create a SessionEvent with an llm_request payload."""
   return SessionEvent(
     event_id=event_id,
     session_id=session_id,
-    timestamp=datetime.now(UTC),
+    timestamp=timestamp,
     turn_id=turn_id,
     agent_name="test_agent",
     llm_request=GenerateContentRequest(
@@ -178,32 +194,70 @@ def _create_llm_request_event(
   )
 
 
+def _response_with_text(text: str) -> GenerateContentResponse:
+  """Create a single-candidate model response containing one text part."""
+  return GenerateContentResponse(
+    candidates=[
+      Candidate(
+        content=Content(
+          parts=[Part(text=text)],
+          role="model",
+        )
+      )
+    ]
+  )
+
+
 def _create_llm_response_event(
   turn_id: str,
   response_text: str = "Human response",
   event_id: str = "event-002",
   session_id: str = "session-001",
+  timestamp: datetime = _FIXED_TS,
 ) -> SessionEvent:
   """Create a SessionEvent with an llm_response payload."""
   return SessionEvent(
     event_id=event_id,
     session_id=session_id,
-    timestamp=datetime.now(UTC),
+    timestamp=timestamp,
     turn_id=turn_id,
     agent_name="test_agent",
-    llm_response=GenerateContentResponse(
-      candidates=[
-        Candidate(
-          content=Content(
-            parts=[Part(text=response_text)],
-            role="model",
-          )
-        )
-      ]
-    ),
+    llm_response=_response_with_text(response_text),
   )
 
 
+def _make_plugin(
+  stub: object,
+  *,
+  session_id: str = "test-session",
+  target_agents: frozenset[str] | None = None,
+) -> SimulatorPlugin:
+  """Create a plugin wired to a fake stub, as if initialize() had already run."""
+  plugin = SimulatorPlugin(target_agents=target_agents)
+  plugin._stub = stub  # type: ignore[assignment]
+  plugin.session_id = session_id
+  return plugin
+
+
+@pytest.fixture
+async def start_listen_loop() -> AsyncIterator[
+  Callable[[SimulatorPlugin], asyncio.Task[None]]
+]:
+  """Start a plugin's listen loop unless already running; cancel it on teardown."""
+  tasks: list[asyncio.Task[None]] = []
+
+  def start(plugin: SimulatorPlugin) -> asyncio.Task[None]:
+    if plugin._listen_task is None:
+      plugin._listen_task = asyncio.create_task(plugin._listen_loop())
+    tasks.append(plugin._listen_task)
+    return plugin._listen_task
+
+  yield start
+  for task in tasks:
+    task.cancel()
+  await asyncio.gather(*tasks, return_exceptions=True)
+
+
 class TestListenLoop:
   """Tests for SimulatorPlugin._listen_loop()."""
 
@@ -216,9 +270,7 @@ class TestListenLoop:
     response_event = _create_llm_response_event(turn_id, response_text)
 
     fake_stub = FakeSimulatorServiceStub(events=[response_event])
-    plugin = SimulatorPlugin()
-    plugin._stub = fake_stub  # type: ignore[assignment]
-    plugin.session_id = "test-session"
+    plugin = _make_plugin(fake_stub)
 
     # Create a pending future for this turn_id
     future = plugin._pending_futures.create(turn_id)
@@ -227,13 +279,14 @@ class TestListenLoop:
     listen_task = asyncio.create_task(plugin._listen_loop())
 
     # Wait for the future to be resolved
-    result = await asyncio.wait_for(future, timeout=1.0)
+    async with asyncio.timeout(1.0):
+      result = await future
 
     # Wait for task to complete (stream ends after yielding all events)
     await listen_task
 
     # Assert
-    assert_that(result.candidates[0].content.parts[0].text, equal_to(response_text))
+    assert result.candidates[0].content.parts[0].text == response_text
 
   @pytest.mark.asyncio
   async def test_listen_loop_ignores_llm_request_events(self) -> None:
@@ -244,22 +297,21 @@ class TestListenLoop:
     response_event = _create_llm_response_event(turn_id)
 
     fake_stub = FakeSimulatorServiceStub(events=[request_event, response_event])
-    plugin = SimulatorPlugin()
-    plugin._stub = fake_stub  # type: ignore[assignment]
-    plugin.session_id = "test-session"
+    plugin = _make_plugin(fake_stub)
 
     # Create pending future
     future = plugin._pending_futures.create(turn_id)
 
     # Act
     listen_task = asyncio.create_task(plugin._listen_loop())
-    result = await asyncio.wait_for(future, timeout=1.0)
+    async with asyncio.timeout(1.0):
+      result = await future
 
     # Wait for task to complete
     await listen_task
 
     # Assert - future was resolved by the response, not affected by request
-    assert_that(result.candidates[0].content.parts[0].text, equal_to("Human response"))
+    assert result.candidates[0].content.parts[0].text == "Human response"
 
   @pytest.mark.asyncio
   async def test_listen_loop_handles_already_resolved_turn_id_idempotently(
@@ -276,22 +328,21 @@ class TestListenLoop:
     )
 
     fake_stub = FakeSimulatorServiceStub(events=[response_event1, response_event2])
-    plugin = SimulatorPlugin()
-    plugin._stub = fake_stub  # type: ignore[assignment]
-    plugin.session_id = "test-session"
+    plugin = _make_plugin(fake_stub)
 
     # Create pending future
     future = plugin._pending_futures.create(turn_id)
 
     # Act
     listen_task = asyncio.create_task(plugin._listen_loop())
-    result = await asyncio.wait_for(future, timeout=1.0)
+    async with asyncio.timeout(1.0):
+      result = await future
 
     # Wait for task to complete (processes both events, second is ignored)
     await listen_task
 
     # Assert - first response was used, duplicate ignored without error
-    assert_that(result.candidates[0].content.parts[0].text, equal_to("First response"))
+    assert result.candidates[0].content.parts[0].text == "First response"
 
   @pytest.mark.asyncio
   async def test_listen_loop_handles_unknown_turn_id_idempotently(self) -> None:
@@ -300,9 +351,7 @@ class TestListenLoop:
     response_event = _create_llm_response_event("unknown-turn-id")
 
     fake_stub = FakeSimulatorServiceStub(events=[response_event])
-    plugin = SimulatorPlugin()
-    plugin._stub = fake_stub  # type: ignore[assignment]
-    plugin.session_id = "test-session"
+    plugin = _make_plugin(fake_stub)
 
     # No pending future created - turn_id is unknown
 
@@ -310,7 +359,7 @@ class TestListenLoop:
     await plugin._listen_loop()
 
     # Assert - no futures pending (none were ever created)
-    assert_that(len(plugin._pending_futures), equal_to(0))
+    assert len(plugin._pending_futures) == 0
 
   @pytest.mark.asyncio
   async def test_listen_loop_exits_when_stub_is_none(self) -> None:
@@ -323,7 +372,7 @@ class TestListenLoop:
     await plugin._listen_loop()
 
     # Assert - no error, just returns
-    assert_that(plugin._stub, is_(None))
+    assert plugin._stub is None
 
   @pytest.mark.asyncio
   async def test_listen_loop_propagates_cancellation(self) -> None:
@@ -334,15 +383,18 @@ class TestListenLoop:
 
     events_yielded: list[str] = []
 
+    # The loop ignores llm_request events, so one shared response will do
+    shared_response = SubscribeResponse(event=_create_llm_request_event("turn-shared"))
+
     async def slow_subscribe(
       request: SubscribeRequest,
     ) -> AsyncIterator[SubscribeResponse]:
       """Slow async generator that can be interrupted."""
       for i in range(100):
         events_yielded.append(f"turn-{i}")
-        yield SubscribeResponse(event=_create_llm_request_event(f"turn-{i}"))
-        # Small delay to allow cancellation between events
-        await asyncio.sleep(0.01)
+        yield shared_response
+        # Yield to the loop so cancellation can land between events
+        await asyncio.sleep(0)
 
     @dataclass
     class SlowFakeStub:
@@ -356,7 +408,8 @@ class TestListenLoop:
 
     # Act
     listen_task = asyncio.create_task(plugin._listen_loop())
-    await asyncio.sleep(0.05)  # Let it process a few events
+    for _ in range(5):  # Let it process a few events
+      await asyncio.sleep(0)
     listen_task.cancel()
 
     # Assert
@@ -364,8 +417,8 @@ class TestListenLoop:
       await listen_task
 
     # Verify at least some events were processed before cancellation
-    assert_that(len(events_yielded) > 0, is_(True))
-    assert_that(len(events_yielded) < 100, is_(True))  # Not all events processed
+    assert len(events_yielded) > 0
+    assert len(events_yielded) < 100  # Not all events processed
 
   @pytest.mark.asyncio
   async def test_listen_loop_propagates_errors(self) -> None:
@@ -373,9 +426,7 @@ class TestListenLoop:
     # Arrange - use error_after=0 to raise immediately on first iteration
     events = [_create_llm_request_event("turn-1")]
     fake_stub = FakeSimulatorServiceStub(events=events, error_after=0)
-    plugin = SimulatorPlugin()
-    plugin._stub = fake_stub  # type: ignore[assignment]
-    plugin.session_id = "test-session"
+    plugin = _make_plugin(fake_stub)
 
     # Act & Assert
     with pytest.raises(RuntimeError, match="Simulated connection error"):
@@ -386,95 +437,83 @@ class TestInitialize:
   """Tests for SimulatorPlugin.initialize()."""
 
   @pytest.mark.asyncio
-  async def test_initialize_prints_banner_with_correct_format(self) -> None:
+  async def test_initialize_prints_banner_with_correct_format(
+    self, capsys: pytest.CaptureFixture[str]
+  ) -> None:
     """initialize() prints a decorated banner with the session URL."""
     # Arrange
     session_id = "abc-123-def-456"
     plugin = SimulatorPlugin(server_url="localhost:50051")
 
-    # Capture stdout
-    captured_output = io.StringIO()
-
     # Act - directly test _print_session_banner
-    sys.stdout = captured_output
-    try:
-      session_url = f"http://localhost:4200/session/{session_id}"
-      plugin._print_session_banner(session_url)
-    finally:
-      sys.stdout = sys.__stdout__
+    session_url = f"http://localhost:4200/session/{session_id}"
+    plugin._print_session_banner(session_url)
 
-    output = captured_output.getvalue()
+    output = capsys.readouterr().out
 
     # Assert - verify banner format
-    assert_that(output, contains_string("=" * 64))
-    assert_that(output, contains_string("[ADK Simulator] Session Started"))
-    assert_that(output, contains_string(f"View and Control at: {session_url}"))
+    assert _BANNER_SEP in output
+    assert "[ADK Simulator] Session Started" in output
+    assert f"View and Control at: {session_url}" in output
 
   @pytest.mark.asyncio
-  async def test_initialize_banner_contains_all_required_elements(self) -> None:
+  async def test_initialize_banner_contains_all_required_elements(
+    self, capsys: pytest.CaptureFixture[str]
+  ) -> None:
     """The banner contains top border, title, URL line, and bottom border."""
     # Arrange
     session_id = "my-session-id"
     plugin = SimulatorPlugin()
     session_url = f"http://localhost:4200/session/{session_id}"
 
-    # Capture stdout
-    captured_output = io.StringIO()
-
     # Act
-    sys.stdout = captured_output
-    try:
-      plugin._print_session_banner(session_url)
-    finally:
-      sys.stdout = sys.__stdout__
+    plugin._print_session_banner(session_url)
 
-    output = captured_output.getvalue()
+    output = capsys.readouterr().out
     lines = output.strip().split("\n")
 
     # Assert - verify structure
     # First and last lines should be the separator
-    assert_that(lines[0], equal_to("=" * 64))
-    assert_that(lines[1], equal_to("[ADK Simulator] Session Started"))
-    assert_that(lines[2], equal_to(f"View and Control at: {session_url}"))
-    assert_that(lines[3], equal_to("=" * 64))
-
-  def test_build_session_url_with_localhost(self) -> None:
-    """_build_session_url() builds correct URL for localhost."""
-    # Arrange
-    plugin = SimulatorPlugin(server_url="localhost:50051")
-    session_id = "session-abc-123"
-
-    # Act
-    url = plugin._build_session_url(session_id)
-
-    # Assert
-    assert_that(url, equal_to("http://localhost:4200/session/session-abc-123"))
-
-  def test_build_session_url_with_http_scheme(self) -> None:
-    """_build_session_url() builds correct URL when server URL has http scheme."""
-    # Arrange
-    plugin = SimulatorPlugin(server_url="http://myserver:50051")
-    session_id = "session-xyz"
-
-    # Act
-    url = plugin._build_session_url(session_id)
-
-    # Assert
-    assert_that(url, equal_to("http://myserver:4200/session/session-xyz"))
-
-  def test_build_session_url_with_custom_host(self) -> None:
-    """_build_session_url() uses the host from server_url."""
+    assert lines[0] == _BANNER_SEP
+    assert lines[1] == "[ADK Simulator] Session Started"
+    assert lines[2] == f"View and Control at: {session_url}"
+    assert lines[3] == _BANNER_SEP
+
+  @pytest.mark.parametrize(
+    ("server_url", "session_id", "expected"),
+    [
+      pytest.param(
+        "localhost:50051",
+        "session-abc-123",
+        "http://localhost:4200/session/session-abc-123",
+        id="localhost",
+      ),
+      pytest.param(
+        "http://myserver:50051",
+        "session-xyz",
+        "http://myserver:4200/session/session-xyz",
+        id="http_scheme",
+      ),
+      pytest.param(
+        "simulator.example.com:50051",
+        "remote-session",
+        "http://simulator.example.com:4200/session/remote-session",
+        id="custom_host",
+      ),
+    ],
+  )
+  def test_build_session_url(
+    self, server_url: str, session_id: str, expected: str
+  ) -> None:
+    """_build_session_url() points at the web UI on the server_url host."""
     # Arrange
-    plugin = SimulatorPlugin(server_url="simulator.example.com:50051")
-    session_id = "remote-session"
+    plugin = SimulatorPlugin(server_url=server_url)
 
     # Act
     url = plugin._build_session_url(session_id)
 
     # Assert
-    assert_that(
-      url, equal_to("http://simulator.example.com:4200/session/remote-session")
-    )
+    assert url == expected
 
   @pytest.mark.asyncio
   async def test_initialize_sets_session_id(self) -> None:
@@ -492,18 +531,18 @@ class TestInitialize:
     # that mocks at a higher level
 
     # Create session directly to verify behavior
-    from adk_sim_protos.adksim.v1 import CreateSessionRequest
-
     response = await fake_stub.create_session(
       CreateSessionRequest(description="test description")
     )
 
     # Assert
-    assert_that(response.session.id, equal_to(session_id))
-    assert_that(fake_stub.session_created, is_(True))
+    assert response.session.id == session_id
+    assert fake_stub.session_created is True
 
   @pytest.mark.asyncio
-  async def test_initialize_starts_listen_loop_task(self) -> None:
+  async def test_initialize_starts_listen_loop_task(
+    self, start_listen_loop: Callable[[SimulatorPlugin], asyncio.Task[None]]
+  ) -> None:
     """initialize() starts the _listen_loop as a background task."""
     # Arrange
     session_id = "task-session"
@@ -515,20 +554,18 @@ class TestInitialize:
     plugin.session_id = session_id
 
     # Act - start the listen loop task
-    plugin._listen_task = asyncio.create_task(plugin._listen_loop())
+    listen_task = start_listen_loop(plugin)
 
     # Assert - task should be created and running
-    assert plugin._listen_task is not None
-    assert_that(plugin._listen_task.done(), is_(False))
-
-    # Cleanup - cancel the task
-    plugin._listen_task.cancel()
-    with contextlib.suppress(asyncio.CancelledError):
-      await plugin._listen_task
+    assert plugin._listen_task is listen_task
+    assert listen_task.done() is False
 
   @pytest.mark.asyncio
   async def test_initialize_integration_with_fake_factory(
-    self, monkeypatch: pytest.MonkeyPatch
+    self,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    start_listen_loop: Callable[[SimulatorPlugin], asyncio.Task[None]],
   ) -> None:
     """Full initialize() flow with injected fake factory."""
     # Arrange
@@ -536,64 +573,37 @@ class TestInitialize:
     fake_stub = FakeInitializingStub(session_id=session_id, events=[])
     fake_factory = FakeInitializingFactory(stub=fake_stub)
 
-    # Capture stdout
-    captured_output = io.StringIO()
-
     # Create plugin
     plugin = SimulatorPlugin(server_url="localhost:50051")
 
-    # Monkeypatch SimulatorClientFactory to return our fake
-    from adk_agent_sim.plugin import client_factory as factory_module
-
-    def fake_init(self: object, config: object) -> None:
-      pass
+    # Swap the factory class core.py constructs for one returning our fake
+    def _factory(config: PluginConfig) -> FakeInitializingFactory:
+      return fake_factory
 
-    monkeypatch.setattr(
-      factory_module.SimulatorClientFactory,
-      "__init__",
-      fake_init,
-    )
-    monkeypatch.setattr(
-      factory_module.SimulatorClientFactory,
-      "get_simulator_stub",
-      fake_factory.get_simulator_stub,
-    )
-    monkeypatch.setattr(
-      factory_module.SimulatorClientFactory,
-      "close",
-      fake_factory.close,
-    )
+    monkeypatch.setattr(core_module, "SimulatorClientFactory", _factory)
 
     # Act
-    sys.stdout = captured_output
-    try:
-      result_url = await plugin.initialize("Test session")
-    finally:
-      sys.stdout = sys.__stdout__
+    result_url = await plugin.initialize("Test session")
 
-    output = captured_output.getvalue()
+    output = capsys.readouterr().out
 
     # Assert - URL returned correctly
-    assert_that(result_url, equal_to(f"http://localhost:4200/session/{session_id}"))
+    assert result_url == f"http://localhost:4200/session/{session_id}"
 
-    # Assert - session_id set
-    assert_that(plugin.session_id, equal_to(session_id))
+    # Assert - session_id set, using the stub from the fake factory
+    assert plugin.session_id == session_id
+    assert fake_factory.connected is True
 
-    # Assert - listen task started
+    # Assert - listen task started (and cancelled by the fixture on teardown)
     assert plugin._listen_task is not None
+    start_listen_loop(plugin)
 
     # Assert - banner printed
-    assert_that(output, contains_string("[ADK Simulator] Session Started"))
-    assert_that(output, contains_string(f"http://localhost:4200/session/{session_id}"))
-
-    # Cleanup
-    if plugin._listen_task:
-      plugin._listen_task.cancel()
-      with contextlib.suppress(asyncio.CancelledError):
-        await plugin._listen_task
+    assert "[ADK Simulator] Session Started" in output
+    assert f"http://localhost:4200/session/{session_id}" in output
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FakeCallbackContext:
   """Fake CallbackContext for testing before_model_callback.
 
@@ -603,12 +613,18 @@ class FakeCallbackContext:
   agent_name: str
 
 
-@dataclass
+def _bounded_event_queue() -> asyncio.Queue[SubscribeResponse]:
+  """Hold at most one undelivered event, like a flow-controlled gRPC stream."""
+  return asyncio.Queue(maxsize=1)
+
+
+@dataclass(slots=True)
 class FakeInterceptingStub:
   """Fake SimulatorServiceStub for testing before_model_callback.
 
   Tracks submitted requests and provides controlled response via event stream.
   Uses an async queue to properly handle concurrent submit/subscribe operations.
+  The queue is bounded, so submit_request waits while the listen loop is behind.
   """
 
   session_id: str = "session-123"
@@ -616,7 +632,19 @@ class FakeInterceptingStub:
     default_factory=list
   )
   response_to_send: GenerateContentResponse | None = None
-  _event_queue: asyncio.Queue[SubscribeResponse] = field(default_factory=asyncio.Queue)
+  _event_queue: asyncio.Queue[SubscribeResponse] = field(
+    default_factory=_bounded_event_queue
+  )
+  _template_event: SessionEvent | None = field(default=None, init=False, repr=False)
+
+  def __post_init__(self) -> None:
+    """Build the response event once; submit_request copies it per turn."""
+    if self.response_to_send:
+      self._template_event = SessionEvent(
+        session_id=self.session_id,
+        timestamp=_FIXED_TS,
+        llm_response=self.response_to_send,
+      )
 
   async def submit_request(
     self, request: SubmitRequestRequest
@@ -625,16 +653,13 @@ class FakeInterceptingStub:
     self.submitted_requests.append(
       (request.turn_id, request.agent_name, request.request)
     )
-    # Dynamically create response event for this turn_id and put in queue
-    if self.response_to_send:
-      event = SessionEvent(
-        event_id=f"event-{request.turn_id}",
-        session_id=self.session_id,
-        timestamp=datetime.now(UTC),
-        turn_id=request.turn_id,
-        agent_name=request.agent_name,
-        llm_response=self.response_to_send,
-      )
+    # Stamp a copy of the template for this turn_id and put it in the queue.
+    # The shallow copy shares the response tree rather than rebuilding it.
+    if self._template_event is not None:
+      event = copy.copy(self._template_event)
+      event.event_id = f"event-{request.turn_id}"
+      event.turn_id = request.turn_id
+      event.agent_name = request.agent_name
       await self._event_queue.put(SubscribeResponse(event=event))
     return SubmitRequestResponse(event_id=f"event-{request.turn_id}")
 
@@ -647,66 +672,57 @@ class FakeInterceptingStub:
       yield response
 
 
+@pytest.fixture(scope="module")
+def hello_llm_request() -> LlmRequest:
+  """A minimal single-turn LlmRequest; the plugin only reads it."""
+  return LlmRequest(
+    model="gemini-2.0-flash",
+    contents=[
+      genai_types.Content(
+        role="user",
+        parts=[genai_types.Part(text="Hello")],
+      )
+    ],
+    config=_EMPTY_CONFIG,
+  )
+
+
 class TestBeforeModelCallback:
   """Tests for SimulatorPlugin.before_model_callback()."""
 
   @pytest.mark.asyncio
-  async def test_before_model_callback_bypasses_non_targeted_agents(self) -> None:
+  async def test_before_model_callback_bypasses_non_targeted_agents(
+    self, hello_llm_request: LlmRequest
+  ) -> None:
     """before_model_callback returns None for non-targeted agents."""
     # Arrange - target only "orchestrator"
-    plugin = SimulatorPlugin(target_agents={"orchestrator"})
+    plugin = SimulatorPlugin(target_agents=frozenset({"orchestrator"}))
     callback_context = FakeCallbackContext(agent_name="worker_agent")
 
-    # Create a minimal LlmRequest using ADK types
-    from google.adk.models.llm_request import LlmRequest
-    from google.genai import types as genai_types
-
-    llm_request = LlmRequest(
-      model="gemini-2.0-flash",
-      contents=[
-        genai_types.Content(
-          role="user",
-          parts=[genai_types.Part(text="Hello")],
-        )
-      ],
-      config=genai_types.GenerateContentConfig(),
-    )
-
     # Act
     result = await plugin.before_model_callback(
       callback_context=callback_context,  # type: ignore[arg-type]
-      llm_request=llm_request,
+      llm_request=hello_llm_request,
     )
 
     # Assert - returns None to let request proceed to real LLM
-    assert_that(result, is_(None))
+    assert result is None
 
   @pytest.mark.asyncio
-  async def test_before_model_callback_intercepts_all_when_no_targets(self) -> None:
+  async def test_before_model_callback_intercepts_all_when_no_targets(
+    self, start_listen_loop: Callable[[SimulatorPlugin], asyncio.Task[None]]
+  ) -> None:
     """before_model_callback intercepts all agents when target_agents is empty."""
     # Arrange
     response_text = "Human provided response"
-    response = GenerateContentResponse(
-      candidates=[
-        Candidate(
-          content=Content(
-            parts=[Part(text=response_text)],
-            role="model",
-          )
-        )
-      ]
-    )
+    response = _response_with_text(response_text)
 
     fake_stub = FakeInterceptingStub(response_to_send=response)
-    plugin = SimulatorPlugin()  # No target_agents = intercept all
-    plugin._stub = fake_stub  # type: ignore[assignment]
-    plugin.session_id = "session-123"
+    # No target_agents = intercept all
+    plugin = _make_plugin(fake_stub, session_id="session-123")
 
     callback_context = FakeCallbackContext(agent_name="any_agent")
 
-    from google.adk.models.llm_request import LlmRequest
-    from google.genai import types as genai_types
-
     llm_request = LlmRequest(
       model="gemini-2.0-flash",
       contents=[
@@ -715,11 +731,11 @@ class TestBeforeModelCallback:
           parts=[genai_types.Part(text="Test message")],
         )
       ],
-      config=genai_types.GenerateContentConfig(),
+      config=_EMPTY_CONFIG,
     )
 
     # Start listen loop to resolve futures
-    plugin._listen_task = asyncio.create_task(plugin._listen_loop())
+    start_listen_loop(plugin)
 
     # Act
     result = await plugin.before_model_callback(
@@ -727,49 +743,36 @@ class TestBeforeModelCallback:
       llm_request=llm_request,
     )
 
-    # Cleanup
-    plugin._listen_task.cancel()
-    with contextlib.suppress(asyncio.CancelledError):
-      await plugin._listen_task
-
     # Assert - request was submitted
-    assert_that(len(fake_stub.submitted_requests), equal_to(1))
+    assert len(fake_stub.submitted_requests) == 1
     _, submitted_agent_name, proto_req = fake_stub.submitted_requests[0]
-    assert_that(submitted_agent_name, equal_to("any_agent"))
-    assert_that(proto_req.model, equal_to("models/gemini-2.0-flash"))
+    assert submitted_agent_name == "any_agent"
+    assert proto_req.model == "models/gemini-2.0-flash"
 
     # Assert - response was returned
     assert result is not None
     assert result.content is not None
     assert result.content.parts is not None
-    assert_that(result.content.parts[0].text, equal_to(response_text))
+    assert result.content.parts[0].text == response_text
 
   @pytest.mark.asyncio
-  async def test_before_model_callback_intercepts_targeted_agent(self) -> None:
+  async def test_before_model_callback_intercepts_targeted_agent(
+    self, start_listen_loop: Callable[[SimulatorPlugin], asyncio.Task[None]]
+  ) -> None:
     """before_model_callback intercepts only targeted agents."""
     # Arrange
     response_text = "Orchestrator response"
-    response = GenerateContentResponse(
-      candidates=[
-        Candidate(
-          content=Content(
-            parts=[Part(text=response_text)],
-            role="model",
-          )
-        )
-      ]
-    )
+    response = _response_with_text(response_text)
 
     fake_stub = FakeInterceptingStub(response_to_send=response)
-    plugin = SimulatorPlugin(target_agents={"orchestrator", "router"})
-    plugin._stub = fake_stub  # type: ignore[assignment]
-    plugin.session_id = "session-123"
+    plugin = _make_plugin(
+      fake_stub,
+      session_id="session-123",
+      target_agents=frozenset({"orchestrator", "router"}),
+    )
 
     callback_context = FakeCallbackContext(agent_name="orchestrator")
 
-    from google.adk.models.llm_request import LlmRequest
-    from google.genai import types as genai_types
-
     llm_request = LlmRequest(
       model="gemini-pro",
       contents=[
@@ -778,11 +781,11 @@ class TestBeforeModelCallback:
           parts=[genai_types.Part(text="Process this")],
         )
       ],
-      config=genai_types.GenerateContentConfig(),
+      config=_EMPTY_CONFIG,
     )
 
     # Start listen loop to resolve futures
-    plugin._listen_task = asyncio.create_task(plugin._listen_loop())
+    start_listen_loop(plugin)
 
     # Act
     result = await plugin.before_model_callback(
@@ -790,134 +793,79 @@ class TestBeforeModelCallback:
       llm_request=llm_request,
     )
 
-    # Cleanup
-    plugin._listen_task.cancel()
-    with contextlib.suppress(asyncio.CancelledError):
-      await plugin._listen_task
-
     # Assert - request was intercepted
-    assert_that(len(fake_stub.submitted_requests), equal_to(1))
+    assert len(fake_stub.submitted_requests) == 1
 
     # Assert - correct response
     assert result is not None
     assert result.content is not None
     assert result.content.parts is not None
-    assert_that(result.content.parts[0].text, equal_to(response_text))
+    assert result.content.parts[0].text == response_text
 
   @pytest.mark.asyncio
-  async def test_before_model_callback_raises_without_initialization(self) -> None:
+  async def test_before_model_callback_raises_without_initialization(
+    self, hello_llm_request: LlmRequest
+  ) -> None:
     """before_model_callback raises RuntimeError when stub is not initialized."""
     # Arrange
     plugin = SimulatorPlugin()
     plugin._stub = None  # Explicitly not initialized
     callback_context = FakeCallbackContext(agent_name="test_agent")
 
-    from google.adk.models.llm_request import LlmRequest
-    from google.genai import types as genai_types
-
-    llm_request = LlmRequest(
-      model="gemini-2.0-flash",
-      contents=[
-        genai_types.Content(
-          role="user",
-          parts=[genai_types.Part(text="Hello")],
-        )
-      ],
-      config=genai_types.GenerateContentConfig(),
-    )
-
     # Act & Assert
     with pytest.raises(RuntimeError, match="Plugin not initialized"):
       await plugin.before_model_callback(
         callback_context=callback_context,  # type: ignore[arg-type]
-        llm_request=llm_request,
+        llm_request=hello_llm_request,
       )
 
   @pytest.mark.asyncio
-  async def test_before_model_callback_generates_unique_turn_ids(self) -> None:
+  async def test_before_model_callback_generates_unique_turn_ids(
+    self,
+    hello_llm_request: LlmRequest,
+    start_listen_loop: Callable[[SimulatorPlugin], asyncio.Task[None]],
+  ) -> None:
     """before_model_callback generates unique turn_id for each call."""
     # Arrange
-    response = GenerateContentResponse(
-      candidates=[
-        Candidate(
-          content=Content(
-            parts=[Part(text="Response")],
-            role="model",
-          )
-        )
-      ]
-    )
+    response = _response_with_text("Response")
 
     fake_stub = FakeInterceptingStub(response_to_send=response)
-    plugin = SimulatorPlugin()
-    plugin._stub = fake_stub  # type: ignore[assignment]
-    plugin.session_id = "session-123"
+    plugin = _make_plugin(fake_stub, session_id="session-123")
 
     callback_context = FakeCallbackContext(agent_name="test_agent")
 
-    from google.adk.models.llm_request import LlmRequest
-    from google.genai import types as genai_types
-
-    llm_request = LlmRequest(
-      model="gemini-2.0-flash",
-      contents=[
-        genai_types.Content(
-          role="user",
-          parts=[genai_types.Part(text="Hello")],
-        )
-      ],
-      config=genai_types.GenerateContentConfig(),
-    )
-
     # Start listen loop
-    plugin._listen_task = asyncio.create_task(plugin._listen_loop())
+    start_listen_loop(plugin)
 
     # Act - make two calls
     await plugin.before_model_callback(
       callback_context=callback_context,  # type: ignore[arg-type]
-      llm_request=llm_request,
+      llm_request=hello_llm_request,
     )
     await plugin.before_model_callback(
       callback_context=callback_context,  # type: ignore[arg-type]
-      llm_request=llm_request,
+      llm_request=hello_llm_request,
     )
 
-    # Cleanup
-    plugin._listen_task.cancel()
-    with contextlib.suppress(asyncio.CancelledError):
-      await plugin._listen_task
-
     # Assert - two different turn_ids
-    assert_that(len(fake_stub.submitted_requests), equal_to(2))
+    assert len(fake_stub.submitted_requests) == 2
     turn_id_1 = fake_stub.submitted_requests[0][0]
     turn_id_2 = fake_stub.submitted_requests[1][0]
     assert turn_id_1 != turn_id_2
 
   @pytest.mark.asyncio
-  async def test_before_model_callback_converts_request_to_proto(self) -> None:
+  async def test_before_model_callback_converts_request_to_proto(
+    self, start_listen_loop: Callable[[SimulatorPlugin], asyncio.Task[None]]
+  ) -> None:
     """before_model_callback correctly converts LlmRequest to GenerateContentRequest."""
     # Arrange
-    response = GenerateContentResponse(
-      candidates=[
-        Candidate(
-          content=Content(
-            parts=[Part(text="Response")],
-            role="model",
-          )
-        )
-      ]
-    )
+    response = _response_with_text("Response")
 
     fake_stub = FakeInterceptingStub(response_to_send=response)
-    plugin = SimulatorPlugin()
-    plugin._stub = fake_stub  # type: ignore[assignment]
-    plugin.session_id = "session-123"
+    plugin = _make_plugin(fake_stub, session_id="session-123")
 
     callback_context = FakeCallbackContext(agent_name="test_agent")
 
-    from google.adk.models.llm_request import LlmRequest
-    from google.genai import types as genai_types
-
     llm_request = LlmRequest(
       model="gemini-2.0-flash",
       contents=[
@@ -933,7 +881,7 @@ class TestBeforeModelCallback:
     )
 
     # Start listen loop
-    plugin._listen_task = asyncio.create_task(plugin._listen_loop())
+    start_listen_loop(plugin)
 
     # Act
     await plugin.before_model_callback(
@@ -941,19 +889,12 @@ class TestBeforeModelCallback:
       llm_request=llm_request,
     )
 
-    # Cleanup
-    plugin._listen_task.cancel()
-    with contextlib.suppress(asyncio.CancelledError):
-      await plugin._listen_task
-
     # Assert - proto request was correctly converted
     _, _, proto_req = fake_stub.submitted_requests[0]
-    assert_that(proto_req.model, equal_to("models/gemini-2.0-flash"))
-    assert_that(proto_req.contents[0].parts[0].text, equal_to("What is 2+2?"))
+    assert proto_req.model == "models/gemini-2.0-flash"
+    assert proto_req.contents[0].parts[0].text == "What is 2+2?"
     assert proto_req.system_instruction is not None
-    assert_that(
-      proto_req.system_instruction.parts[0].text, equal_to("You are a math tutor.")
-    )
+    assert proto_req.system_instruction.parts[0].text == "You are a math tutor."
 
 
 @dataclass
@@ -961,27 +902,63 @@ class FakeReconnectingStub:
   """Fake SimulatorServiceStub for testing reconnection logic (T052).
 
   Simulates a connection that fails after N events, then succeeds on reconnect.
+  Like the server, a resubscribe replays the whole event log after the
+  request's last_event_id (or all of it when that id is empty or unknown).
   """
 
   events_before_failure: list[SessionEvent] = field(default_factory=list)
   events_after_reconnect: list[SessionEvent] = field(default_factory=list)
+  subscribe_requests: list[SubscribeRequest] = field(default_factory=list)
   _failed_once: bool = False
+  _responses: list[SubscribeResponse] = field(init=False, repr=False)
+  _event_ids: list[str] = field(init=False, repr=False)
+
+  def __post_init__(self) -> None:
+    """Wrap the event log once, so each subscribe() just replays a slice of it."""
+    log = self.events_before_failure + self.events_after_reconnect
+    self._responses = [SubscribeResponse(event=event) for event in log]
+    self._event_ids = [event.event_id for event in log]
 
   async def subscribe(
     self, request: SubscribeRequest
   ) -> AsyncIterator[SubscribeResponse]:
-    """Yield events then fail, or yield reconnect events."""
-    from grpclib.exceptions import StreamTerminatedError
-
+    """Yield events then fail, or replay the log after last_event_id."""
+    self.subscribe_requests.append(request)
     if not self._failed_once:
-      for event in self.events_before_failure:
-        yield SubscribeResponse(event=event)
+      for response in self._responses[: len(self.events_before_failure)]:
+        yield response
       self._failed_once = True
       raise StreamTerminatedError("Connection lost")
 
     # After reconnect
-    for event in self.events_after_reconnect:
-      yield SubscribeResponse(event=event)
+    start = 0
+    if request.last_event_id in self._event_ids:
+      start = self._event_ids.index(request.last_event_id) + 1
+    for response in self._responses[start:]:
+      yield response
+
+
+@dataclass
+class FakeUnavailableStub:
+  """Fake SimulatorServiceStub whose subscribe() always fails with UNAVAILABLE.
+
+  Records the loop time of each attempt and sets `retried` once
+  `retry_target` attempts have been made.
+  """
+
+  retry_target: int = 3
+  retry_times: list[float] = field(default_factory=list)
+  retried: asyncio.Event = field(default_factory=asyncio.Event)
+
+  async def subscribe(
+    self, request: SubscribeRequest
+  ) -> AsyncIterator[SubscribeResponse]:
+    """Record the attempt, then fail."""
+    self.retry_times.append(asyncio.get_running_loop().time())
+    if len(self.retry_times) >= self.retry_target:
+      self.retried.set()
+    raise GRPCError(Status.UNAVAILABLE, "Server unavailable")
+    yield  # Never reached - makes this a generator
 
 
 @dataclass
@@ -991,11 +968,13 @@ class FakeReconnectingFactory:
   Tracks connect/close calls and provides stub access.
   """
 
-  stub: FakeReconnectingStub
+  stub: FakeReconnectingStub | FakeUnavailableStub
   get_stub_count: int = 0
   close_count: int = 0
 
-  async def get_simulator_stub(self) -> FakeReconnectingStub:
+  async def get_simulator_stub(
+    self,
+  ) -> FakeReconnectingStub | FakeUnavailableStub:
     """Return the fake stub and increment counter."""
     self.get_stub_count += 1
     return self.stub
@@ -1036,16 +1015,44 @@ class TestPluginReconnection:
     listen_task = asyncio.create_task(plugin._listen_loop())
 
     # Wait for future to resolve (through reconnection)
-    result = await asyncio.wait_for(future, timeout=2.0)
+    async with asyncio.timeout(2.0):
+      result = await future
 
     # Stop the loop
     plugin._shutting_down = True
     await listen_task
 
     # Assert - reconnection happened
-    assert_that(fake_factory.get_stub_count, equal_to(1))  # One reconnect
-    assert_that(fake_factory.close_count, equal_to(1))  # Closed before reconnect
-    assert_that(result.candidates[0].content.parts[0].text, equal_to("After reconnect"))
+    assert fake_factory.get_stub_count == 1  # One reconnect
+    assert fake_factory.close_count == 1  # Closed before reconnect
+    assert result.candidates[0].content.parts[0].text == "After reconnect"
+
+  @pytest.mark.asyncio
+  async def test_reconnection_resumes_after_last_event_id(self) -> None:
+    """Resubscribing sends the last received event_id to skip seen history."""
+    # Arrange
+    before = _create_llm_response_event("turn-before", "Before", event_id="ev-1")
+    after = _create_llm_response_event("turn-after", "After", event_id="ev-2")
+
+    fake_stub = FakeReconnectingStub(
+      events_before_failure=[before],
+      events_after_reconnect=[after],
+    )
+    plugin = _make_plugin(fake_stub)
+    plugin._factory = FakeReconnectingFactory(stub=fake_stub)  # type: ignore[assignment]
+    plugin._initial_backoff = 0.01
+
+    future_before = plugin._pending_futures.create("turn-before")
+    future_after = plugin._pending_futures.create("turn-after")
+
+    # Act - the loop exits on its own once the reconnected stream ends
+    async with asyncio.timeout(2.0):
+      await plugin._listen_loop()
+
+    # Assert - first subscribe replays everything, the resubscribe resumes
+    assert [r.last_event_id for r in fake_stub.subscribe_requests] == ["", "ev-1"]
+    assert future_before.result().candidates[0].content.parts[0].text == "Before"
+    assert future_after.result().candidates[0].content.parts[0].text == "After"
 
   @pytest.mark.asyncio
   async def test_exponential_backoff_timing(self) -> None:
@@ -1055,52 +1062,25 @@ class TestPluginReconnection:
     plugin._initial_backoff = 0.01
     plugin._max_backoff = 0.08
     plugin._backoff_multiplier = 2.0
+    plugin._backoff_jitter = 0.0  # Deterministic schedule
 
-    retry_times: list[float] = []
-
-    @dataclass
-    class AlwaysFailingStub:
-      """Stub that always fails on subscribe."""
-
-      async def subscribe(
-        self, request: SubscribeRequest
-      ) -> AsyncIterator[SubscribeResponse]:
-        from grpclib.const import Status
-        from grpclib.exceptions import GRPCError
-
-        retry_times.append(asyncio.get_event_loop().time())
-        raise GRPCError(Status.UNAVAILABLE, "Server unavailable")
-        yield  # Never reached - makes this a generator
-
-    @dataclass
-    class AlwaysFailingFactory:
-      """Factory that returns always-failing stub."""
-
-      stub: AlwaysFailingStub
-      get_stub_count: int = 0
-
-      async def get_simulator_stub(self) -> AlwaysFailingStub:
-        self.get_stub_count += 1
-        return self.stub
-
-      async def close(self) -> None:
-        pass
-
-    fake_stub = AlwaysFailingStub()
-    fake_factory = AlwaysFailingFactory(stub=fake_stub)
+    fake_stub = FakeUnavailableStub(retry_target=3)
+    fake_factory = FakeReconnectingFactory(stub=fake_stub)
     plugin._stub = fake_stub  # type: ignore[assignment]
     plugin._factory = fake_factory  # type: ignore[assignment]
     plugin.session_id = "test-session"
 
-    # Act - run for a short time
+    # Act - run until the third subscribe attempt
     listen_task = asyncio.create_task(plugin._listen_loop())
-    await asyncio.sleep(0.25)  # Let it retry a few times
+    async with asyncio.timeout(2.0):
+      await fake_stub.retried.wait()
     plugin._shutting_down = True
     listen_task.cancel()
     with contextlib.suppress(asyncio.CancelledError):
       await listen_task
 
     # Assert - verify backoff pattern (at least 3 retries)
+    retry_times = fake_stub.retry_times
     assert len(retry_times) >= 3, f"Expected at least 3 retries, got {len(retry_times)}"
     # Check delays increase (with tolerance for timing)
     if len(retry_times) >= 3:
@@ -1111,65 +1091,42 @@ class TestPluginReconnection:
         f"Backoff not increasing: {delay1:.3f} -> {delay2:.3f}"
       )
 
+  def test_backoff_jitter_stays_within_bounds(self) -> None:
+    """Jittered reconnect delays stay within ±_backoff_jitter of the backoff."""
+    # Arrange
+    plugin = SimulatorPlugin()
+    plugin._backoff_jitter = 0.2
+
+    # Act
+    delays = {plugin._jittered_backoff(1.0) for _ in range(200)}
+
+    # Assert - bounded, and actually spread rather than a fixed schedule
+    assert all(0.8 <= delay <= 1.2 for delay in delays)
+    assert len(delays) > 1
+
   @pytest.mark.asyncio
   async def test_reconnection_uses_existing_session_id(self) -> None:
     """Reconnection restores session_id to client (T050)."""
     # Arrange
     existing_session_id = "existing-session-456"
 
-    @dataclass
-    class TrackingStub:
-      """Stub that tracks subscribe requests."""
-
-      subscribe_session_ids: list[str] = field(default_factory=list)
-      _should_fail: bool = True
-
-      async def subscribe(
-        self, request: SubscribeRequest
-      ) -> AsyncIterator[SubscribeResponse]:
-        from grpclib.exceptions import StreamTerminatedError
-
-        self.subscribe_session_ids.append(request.session_id)
-        if self._should_fail:
-          self._should_fail = False
-          raise StreamTerminatedError("Connection lost")
-        # Empty stream after reconnect
-        return
-        yield  # Makes this a generator
-
-    @dataclass
-    class TrackingFactory:
-      """Factory that tracks stub access."""
-
-      stub: TrackingStub
-      get_stub_count: int = 0
-
-      async def get_simulator_stub(self) -> TrackingStub:
-        self.get_stub_count += 1
-        return self.stub
-
-      async def close(self) -> None:
-        pass
-
-    fake_stub = TrackingStub()
-    fake_factory = TrackingFactory(stub=fake_stub)
+    # Fails once with no events, then an empty stream after reconnect
+    fake_stub = FakeReconnectingStub()
+    fake_factory = FakeReconnectingFactory(stub=fake_stub)
     plugin = SimulatorPlugin()
     plugin._factory = fake_factory  # type: ignore[assignment]
     plugin._stub = fake_stub  # type: ignore[assignment]
     plugin.session_id = existing_session_id
     plugin._initial_backoff = 0.01
 
-    # Act
-    listen_task = asyncio.create_task(plugin._listen_loop())
-    await asyncio.sleep(0.1)
-    plugin._shutting_down = True
-    await listen_task
+    # Act - the loop exits on its own once the reconnected stream ends
+    async with asyncio.timeout(2.0):
+      await plugin._listen_loop()
 
     # Assert - session_id was passed in subscribe requests
     # First call before failure, second after reconnect
-    assert len(fake_stub.subscribe_session_ids) >= 1
-    for session_id in fake_stub.subscribe_session_ids:
-      assert_that(session_id, equal_to(existing_session_id))
+    session_ids = [request.session_id for request in fake_stub.subscribe_requests]
+    assert session_ids == [existing_session_id] * 2
 
   @pytest.mark.asyncio
   async def test_replayed_events_are_filtered(self) -> None:
@@ -1192,9 +1149,7 @@ class TestPluginReconnection:
     )
 
     fake_stub = FakeSimulatorServiceStub(events=[response1, replayed, response2])
-    plugin = SimulatorPlugin()
-    plugin._stub = fake_stub  # type: ignore[assignment]
-    plugin.session_id = "test-session"
+    plugin = _make_plugin(fake_stub)
 
     # Create futures
     future1 = plugin._pending_futures.create(already_resolved_turn_id)
@@ -1204,14 +1159,15 @@ class TestPluginReconnection:
     listen_task = asyncio.create_task(plugin._listen_loop())
 
     # Wait for both futures
-    result1 = await asyncio.wait_for(future1, timeout=1.0)
-    result2 = await asyncio.wait_for(future2, timeout=1.0)
+    async with asyncio.timeout(1.0):
+      result1 = await future1
+      result2 = await future2
 
     await listen_task
 
     # Assert - first response used (not the replay)
-    assert_that(result1.candidates[0].content.parts[0].text, equal_to("First response"))
-    assert_that(result2.candidates[0].content.parts[0].text, equal_to("New response"))
+    assert result1.candidates[0].content.parts[0].text == "First response"
+    assert result2.candidates[0].content.parts[0].text == "New response"
 
   @pytest.mark.asyncio
   async def test_close_sets_shutdown_flag(self) -> None:
@@ -1219,22 +1175,13 @@ class TestPluginReconnection:
     # Arrange
     plugin = SimulatorPlugin()
 
-    @dataclass
-    class FakeClosingFactory:
-      """Factory with close() method for testing shutdown."""
-
-      closed: bool = False
-
-      async def close(self) -> None:
-        self.closed = True
-
-    fake_factory = FakeClosingFactory()
+    fake_factory = FakeInitializingFactory()
     plugin._factory = fake_factory  # type: ignore[assignment]
 
     # Act
-    assert_that(plugin._shutting_down, is_(False))
+    assert plugin._shutting_down is False
     await plugin.close()
 
     # Assert
-    assert_that(plugin._shutting_down, is_(True))
-    assert_that(fake_factory.closed, is_(True))
+    assert plugin._shutting_down is True
+    assert fake_factory.closed is True
@@ -10,6 +10,7 @@ Usage:
 
 import asyncio
 import sys
+from collections.abc import Callable
 from pathlib import Path
 from typing import Annotated
 
@@ -196,6 +197,20 @@ async def serve(
     logger.info("Server shutdown complete")
 
 
+def _event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+  """Return uvloop's event loop factory, or None for the default asyncio loop.
+
+  uvloop moves socket readiness handling for both the gRPC and web servers
+  into libuv. It does not support Windows, where the default loop is used.
+  """
+  if sys.platform == "win32":
+    return None
+
+  import uvloop
+
+  return uvloop.new_event_loop
+
+
 @app.callback(invoke_without_command=True)
 def run(
   port: Annotated[int, typer.Option("--port", "-p", help="gRPC server port")] = 50051,
@@ -214,7 +229,10 @@ def run(
   Starts both the gRPC server (for plugin communication) and the web server
   (for the browser UI) concurrently.
   """
-  asyncio.run(serve(grpc_port=port, web_port=web_port, db_url=db_url))
+  asyncio.run(
+    serve(grpc_port=port, web_port=web_port, db_url=db_url),
+    loop_factory=_event_loop_factory(),
+  )
 
 
 if __name__ == "__main__":
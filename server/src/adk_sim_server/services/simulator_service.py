@@ -162,16 +162,27 @@ class SimulatorService(SimulatorServiceBase):
     Uses the EventBroadcaster's atomic history+subscribe mechanism
     to prevent race conditions where events could be missed.
 
+    A reconnecting client can set last_event_id to skip the history it
+    already received; replay then starts right after that event. An id the
+    server doesn't know falls back to the full history.
+
     Args:
-        subscribe_request: SubscribeRequest containing the session ID.
+        subscribe_request: SubscribeRequest containing the session ID and
+            optionally the last event ID the client received.
 
     Yields:
         SubscribeResponse containing session events.
     """
     session_id = subscribe_request.session_id
+    last_event_id = subscribe_request.last_event_id
 
     async def _fetch_history() -> list[SessionEvent]:
-      return await self._event_repo.get_by_session(session_id)
+      history = await self._event_repo.get_by_session(session_id)
+      if last_event_id:
+        for i, event in enumerate(history):
+          if event.event_id == last_event_id:
+            return history[i + 1 :]
+      return history
 
     async for event in self._event_broadcaster.subscribe(session_id, _fetch_history):
       yield SubscribeResponse(event=event)
@@ -8,12 +8,13 @@ The gateway avoids loopback network calls by invoking service methods
 directly in-process.
 """
 
-import base64
+import hashlib
 import struct
 from collections.abc import AsyncIterator
 from pathlib import Path
 
 import betterproto
+import pybase64
 from adk_sim_protos.adksim.v1 import (
   CreateSessionRequest,
   CreateSessionResponse,
@@ -25,8 +26,11 @@ from adk_sim_protos.adksim.v1 import (
   SubmitRequestResponse,
   SubscribeRequest,
 )
+from grpclib.const import Status
+from grpclib.exceptions import GRPCError
 from starlette.applications import Starlette
-from starlette.requests import Request
+from starlette.datastructures import State
+from starlette.requests import ClientDisconnect, Request
 from starlette.responses import FileResponse, Response, StreamingResponse
 from starlette.routing import Route
 
@@ -39,6 +43,30 @@ logger = get_logger("web")
 # Angular builds to static/browser/ within the package
 STATIC_DIR = Path(__file__).parent / "static" / "browser"
 
+# Trailer frame for a successful unary call: 0x80 (trailer flag) + length +
+# trailers. It never changes, so it is built once at import time.
+_OK_TRAILERS = b"grpc-status:0\r\n"
+_OK_TRAILER_FRAME = struct.pack(">BI", 0x80, len(_OK_TRAILERS)) + _OK_TRAILERS
+_OK_TRAILER_FRAME_TEXT = pybase64.b64encode(_OK_TRAILER_FRAME)
+
+# Media types a client can list in Accept to receive binary gRPC-Web frames
+_BINARY_CONTENT_TYPES = frozenset(
+  {"application/grpc-web", "application/grpc-web+proto"}
+)
+
+# Headers shared by every gRPC-Web response and by CORS preflight replies.
+# Starlette copies these into each response, so the dicts are never mutated.
+_CORS_HEADERS = {
+  "access-control-allow-origin": "*",
+  "access-control-expose-headers": "grpc-status,grpc-message",
+}
+_PREFLIGHT_HEADERS = {
+  "access-control-allow-origin": "*",
+  "access-control-allow-methods": "POST, OPTIONS",
+  "access-control-allow-headers": "content-type, x-grpc-web, x-user-agent",
+  "access-control-max-age": "86400",
+}
+
 
 def _decode_grpc_web_payload(body: bytes, is_text: bool) -> bytes:
   """Decode a gRPC-Web payload.
@@ -51,20 +79,27 @@ def _decode_grpc_web_payload(body: bytes, is_text: bool) -> bytes:
       is_text: Whether the payload is base64-encoded (grpc-web-text).
 
   Returns:
-      The decoded protobuf message bytes.
+      The protobuf message bytes.
   """
   if is_text:
-    body = base64.b64decode(body)
+    body = pybase64.b64decode(body, validate=False)
 
   # gRPC message format: 1 byte compressed flag + 4 bytes message length + message
-  if len(body) < 5:
-    msg = f"Invalid gRPC-Web payload: too short ({len(body)} bytes)"
-    raise ValueError(msg)
-
   # First byte is compression flag (0 = uncompressed)
-  # Next 4 bytes are message length in big-endian
-  _compressed_flag = body[0]
-  message_length = struct.unpack(">I", body[1:5])[0]
+  # Next 4 bytes are message length in big-endian (-1 if the header is missing)
+  body_length = len(body)
+  message_length = (
+    body[1] << 24 | body[2] << 16 | body[3] << 8 | body[4] if body_length >= 5 else -1
+  )
+  if message_length < 0 or 5 + message_length > body_length:
+    if message_length < 0:
+      msg = f"Invalid gRPC-Web payload: too short ({body_length} bytes)"
+    else:
+      msg = (
+        f"Invalid gRPC-Web payload: declares {message_length} message bytes "
+        f"but only {body_length - 5} were received"
+      )
+    raise ValueError(msg)
 
   return body[5 : 5 + message_length]
 
@@ -84,17 +119,14 @@ def _encode_grpc_web_response(message: betterproto.Message, is_text: bool) -> by
   # Serialize the message using betterproto
   message_bytes = bytes(message)
 
-  # Build message frame: 0 (not compressed) + length + message
-  message_frame = bytes([0]) + struct.pack(">I", len(message_bytes)) + message_bytes
-
-  # Build trailer frame: 0x80 (trailer flag) + length + trailers
-  trailers = b"grpc-status:0\r\n"
-  trailer_frame = bytes([0x80]) + struct.pack(">I", len(trailers)) + trailers
-
-  response = message_frame + trailer_frame
+  # Message frame header (0 = not compressed, then length) + message + OK
+  # trailer, joined into a single buffer so the frames are copied only once.
+  response = b"".join(
+    (struct.pack(">BI", 0, len(message_bytes)), message_bytes, _OK_TRAILER_FRAME)
+  )
 
   if is_text:
-    response = base64.b64encode(response)
+    response = pybase64.b64encode(response)
 
   return response
 
@@ -104,6 +136,29 @@ def _get_content_type(is_text: bool) -> str:
   return "application/grpc-web-text" if is_text else "application/grpc-web+proto"
 
 
+def _is_text_response(request: Request, is_text: bool) -> bool:
+  """Decide whether to base64-encode the response (grpc-web-text).
+
+  Text requests normally get text responses, but a client that also lists a
+  binary gRPC-Web type in its Accept header gets binary frames instead, which
+  avoids a base64 pass and the ~33% size overhead on the wire.
+
+  Args:
+      request: The incoming Starlette request.
+      is_text: Whether the request payload was base64-encoded.
+
+  Returns:
+      True if the response should be sent as grpc-web-text.
+  """
+  if not is_text:
+    return False
+  accepted = {
+    media_type.split(";", 1)[0].strip()
+    for media_type in request.headers.get("accept", "").split(",")
+  }
+  return accepted.isdisjoint(_BINARY_CONTENT_TYPES)
+
+
 def _encode_grpc_web_message_frame(
   message: betterproto.Message, is_text: bool
 ) -> bytes:
@@ -120,7 +175,7 @@ def _encode_grpc_web_message_frame(
   # Build message frame: 0 (not compressed) + length + message
   frame = bytes([0]) + struct.pack(">I", len(message_bytes)) + message_bytes
   if is_text:
-    frame = base64.b64encode(frame)
+    frame = pybase64.b64encode(frame)
   return frame
 
 
@@ -137,13 +192,15 @@ def _encode_grpc_web_trailer(
   Returns:
       The encoded gRPC-Web trailer frame bytes.
   """
-  trailers = f"grpc-status:{status}\r\n"
+  if status == 0 and not message:
+    return _OK_TRAILER_FRAME_TEXT if is_text else _OK_TRAILER_FRAME
+
+  trailers = b"grpc-status:%d\r\n" % status
   if message:
-    trailers += f"grpc-message:{message}\r\n"
-  trailers_bytes = trailers.encode()
-  frame = bytes([0x80]) + struct.pack(">I", len(trailers_bytes)) + trailers_bytes
+    trailers += b"grpc-message:" + message.encode() + b"\r\n"
+  frame = struct.pack(">BI", 0x80, len(trailers)) + trailers
   if is_text:
-    frame = base64.b64encode(frame)
+    frame = pybase64.b64encode(frame)
   return frame
 
 
@@ -165,10 +222,33 @@ async def _stream_grpc_web_responses(
       yield _encode_grpc_web_message_frame(message, is_text)
     # Stream completed successfully - send OK trailer
     yield _encode_grpc_web_trailer(is_text, status=0)
+  except GRPCError as e:
+    # Service-reported gRPC error - forward its status as-is
+    yield _encode_grpc_web_trailer(
+      is_text, status=e.status.value, message=e.message or ""
+    )
   except Exception as e:
     logger.exception("Error during stream: %s", e)
     # Send error trailer
-    yield _encode_grpc_web_trailer(is_text, status=2, message=str(e))
+    yield _encode_grpc_web_trailer(is_text, status=Status.UNKNOWN.value, message=str(e))
+
+
+def _grpc_web_error_response(is_text: bool, status: Status, message: str) -> Response:
+  """Build a trailers-only gRPC-Web response reporting an error status.
+
+  Args:
+      is_text: Whether to base64-encode the trailer (grpc-web-text).
+      status: gRPC status to report.
+      message: Error message for the grpc-message trailer.
+
+  Returns:
+      The gRPC-Web error response.
+  """
+  return Response(
+    content=_encode_grpc_web_trailer(is_text, status=status.value, message=message),
+    media_type=_get_content_type(is_text),
+    headers=_CORS_HEADERS,
+  )
 
 
 # Method name to (request_class, handler_method_name) mapping
@@ -203,45 +283,42 @@ async def grpc_web_subscribe_handler(request: Request) -> Response:
   # Check content type to determine if base64 encoded
   content_type = request.headers.get("content-type", "")
   is_text = "grpc-web-text" in content_type
+  text_response = _is_text_response(request, is_text)
 
   # Get the service from app state
   service: SimulatorService = request.app.state.simulator_service
 
+  # Read, decode and parse the SubscribeRequest. Malformed frames and
+  # protobufs raise ValueError; truncated protobufs raise EOFError.
+  # Body read failures are still answered with an error trailer.
   try:
-    # Read and decode the request body
     body = await request.body()
     message_bytes = _decode_grpc_web_payload(body, is_text)
-
-    # Parse the SubscribeRequest
     subscribe_request = SubscribeRequest().parse(message_bytes)
+  except (ValueError, EOFError) as e:
+    logger.warning("Malformed Subscribe request: %s", e)
+    return _grpc_web_error_response(text_response, Status.INVALID_ARGUMENT, str(e))
+  except ClientDisconnect:
+    logger.info("Client disconnected before sending Subscribe request")
+    return _grpc_web_error_response(
+      text_response, Status.CANCELLED, "Client disconnected"
+    )
+  except Exception as e:
+    logger.exception("Error reading Subscribe request: %s", e)
+    return _grpc_web_error_response(text_response, Status.UNKNOWN, str(e))
 
-    logger.info("Subscribe request for session: %s", subscribe_request.session_id)
-
-    # Get the response stream from the service
-    response_stream = service.subscribe(subscribe_request)
+  logger.info("Subscribe request for session: %s", subscribe_request.session_id)
 
-    # Return a streaming response
-    return StreamingResponse(
-      _stream_grpc_web_responses(response_stream, is_text),
-      media_type=_get_content_type(is_text),
-      headers={
-        "access-control-allow-origin": "*",
-        "access-control-expose-headers": "grpc-status,grpc-message",
-      },
-    )
+  # Get the response stream from the service. It is an async generator, so
+  # service errors surface while streaming and are reported in the trailer.
+  response_stream = service.subscribe(subscribe_request)
 
-  except Exception as e:
-    logger.exception("Error handling Subscribe request: %s", e)
-    # Return gRPC error status
-    error_frame = _encode_grpc_web_trailer(is_text, status=2, message=str(e))
-    return Response(
-      content=error_frame,
-      media_type=_get_content_type(is_text),
-      headers={
-        "access-control-allow-origin": "*",
-        "access-control-expose-headers": "grpc-status,grpc-message",
-      },
-    )
+  # Return a streaming response
+  return StreamingResponse(
+    _stream_grpc_web_responses(response_stream, text_response),
+    media_type=_get_content_type(text_response),
+    headers=_CORS_HEADERS,
+  )
 
 
 async def grpc_web_handler(request: Request) -> Response:
@@ -268,78 +345,85 @@ async def grpc_web_handler(request: Request) -> Response:
   if method_name == "Subscribe":
     return await grpc_web_subscribe_handler(request)
 
-  if method_name not in _METHOD_MAP:
+  # Request class and bound service method, resolved once in create_app
+  dispatch = request.app.state.dispatch.get(method_name)
+  if dispatch is None:
     logger.warning("Unknown gRPC method: %s", method_name)
     return Response(status_code=404, content=f"Unknown method: {method_name}")
+  request_class, handler = dispatch
 
   # Check content type to determine if base64 encoded
   content_type = request.headers.get("content-type", "")
   is_text = "grpc-web-text" in content_type
+  text_response = _is_text_response(request, is_text)
 
-  # Get the service from app state
-  service: SimulatorService = request.app.state.simulator_service
-
+  # Read, decode and parse the request message using betterproto. Malformed
+  # frames and protobufs raise ValueError; truncated protobufs raise EOFError.
+  # Body read failures are still answered with an error trailer.
   try:
-    # Read and decode the request body
     body = await request.body()
     message_bytes = _decode_grpc_web_payload(body, is_text)
-
-    # Get request class and method name
-    request_class, handler_name = _METHOD_MAP[method_name]
-
-    # Parse the request message using betterproto
     request_message = request_class().parse(message_bytes)
+  except (ValueError, EOFError) as e:
+    logger.warning("Malformed gRPC-Web request for %s: %s", method_name, e)
+    return _grpc_web_error_response(text_response, Status.INVALID_ARGUMENT, str(e))
+  except ClientDisconnect:
+    logger.info("Client disconnected before sending %s request", method_name)
+    return _grpc_web_error_response(
+      text_response, Status.CANCELLED, "Client disconnected"
+    )
+  except Exception as e:
+    logger.exception("Error reading gRPC-Web request for %s: %s", method_name, e)
+    return _grpc_web_error_response(text_response, Status.UNKNOWN, str(e))
 
+  try:
     # Call the service method directly (in-memory, no loopback)
-    handler = getattr(service, handler_name)
     response_message = await handler(request_message)
-
-    # Encode and return the response
-    response_bytes = _encode_grpc_web_response(response_message, is_text)
-
-    return Response(
-      content=response_bytes,
-      media_type=_get_content_type(is_text),
-      headers={
-        "access-control-allow-origin": "*",
-        "access-control-expose-headers": "grpc-status,grpc-message",
-      },
-    )
-
+    response_bytes = _encode_grpc_web_response(response_message, text_response)
+  except GRPCError as e:
+    # Service-reported gRPC error - forward its status as-is
+    return _grpc_web_error_response(text_response, e.status, e.message or "")
   except Exception as e:
     logger.exception("Error handling gRPC-Web request: %s", e)
-    # Return gRPC error status
-    error_trailers = f"grpc-status:2\r\ngrpc-message:{e!s}\r\n".encode()
-    error_frame = (
-      bytes([0x80]) + struct.pack(">I", len(error_trailers)) + error_trailers
-    )
+    return _grpc_web_error_response(text_response, Status.UNKNOWN, str(e))
 
-    if is_text:
-      error_frame = base64.b64encode(error_frame)
-
-    return Response(
-      content=error_frame,
-      media_type=_get_content_type(is_text),
-      headers={
-        "access-control-allow-origin": "*",
-        "access-control-expose-headers": "grpc-status,grpc-message",
-      },
-    )
+  return Response(
+    content=response_bytes,
+    media_type=_get_content_type(text_response),
+    headers=_CORS_HEADERS,
+  )
 
 
 async def grpc_web_options(request: Request) -> Response:
   """Handle CORS preflight requests for gRPC-Web endpoints."""
   return Response(
     status_code=204,
-    headers={
-      "access-control-allow-origin": "*",
-      "access-control-allow-methods": "POST, OPTIONS",
-      "access-control-allow-headers": "content-type, x-grpc-web, x-user-agent",
-      "access-control-max-age": "86400",
-    },
+    headers=_PREFLIGHT_HEADERS,
   )
 
 
+def _load_index_html(state: State) -> tuple[bytes, str] | None:
+  """Return index.html and its ETag, or None if the frontend is not bundled.
+
+  The file is kept in memory keyed on its mtime and size, so a rebuilt
+  frontend is picked up on the next request while an unchanged one costs a
+  single stat instead of a read and hash.
+  """
+  try:
+    stat = (STATIC_DIR / "index.html").stat()
+  except OSError:
+    return None
+
+  key = (stat.st_mtime_ns, stat.st_size)
+  cached: tuple[tuple[int, int], bytes, str] | None = state.index_cache
+  if cached is None or cached[0] != key:
+    index_html = (STATIC_DIR / "index.html").read_bytes()
+    digest = hashlib.blake2b(index_html, digest_size=8).hexdigest()
+    cached = (key, index_html, f'"{digest}"')
+    state.index_cache = cached
+  return cached[1], cached[2]
+
+
 async def spa_handler(request: Request) -> Response:
   """Serve static files or fall back to index.html for SPA routing.
 
@@ -356,11 +440,15 @@ async def spa_handler(request: Request) -> Response:
       return FileResponse(file_path)
 
   # 2. Fallback to index.html for everything else (e.g., /session/123)
-  index_path = STATIC_DIR / "index.html"
-  if index_path.exists():
-    return FileResponse(index_path)
+  index = _load_index_html(request.app.state)
+  if index is None:
+    return Response(status_code=404, content="Frontend not bundled")
 
-  return Response(status_code=404, content="Frontend not bundled")
+  index_html, index_etag = index
+  headers = {"cache-control": "no-cache", "etag": index_etag}
+  if request.headers.get("if-none-match") == index_etag:
+    return Response(status_code=304, headers=headers)
+  return Response(content=index_html, media_type="text/html", headers=headers)
 
 
 def create_app(simulator_service: SimulatorService) -> Starlette:
@@ -398,4 +486,14 @@ def create_app(simulator_service: SimulatorService) -> Starlette:
   # Store the service in app state for access in handlers
   app.state.simulator_service = simulator_service
 
+  # index.html and its ETag, filled in by the first SPA route request
+  app.state.index_cache = None
+
+  # Resolve each unary method to its bound service handler once, so requests
+  # only need a single dict lookup to dispatch
+  app.state.dispatch = {
+    method_name: (request_class, getattr(simulator_service, handler_name))
+    for method_name, (request_class, handler_name) in _METHOD_MAP.items()
+  }
+
   return app
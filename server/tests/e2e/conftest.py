@@ -1,19 +1,34 @@
 """E2E test fixtures using pytest-docker."""
 
 import socket
+import time
 from collections.abc import AsyncGenerator
 from pathlib import Path
 
 import pytest
+import pytest_asyncio
+from adk_sim_protos.adksim.v1 import SimulatorServiceStub
 from grpclib.client import Channel
+from pytest_asyncio import is_async_test
 from pytest_docker.plugin import Services
 
 
 def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
-  """Apply default timeout of 120 seconds to all e2e tests."""
+  """Apply default timeout of 120 seconds to all e2e tests.
+
+  Async e2e tests also run on the session-scoped event loop so they can share
+  the session-scoped gRPC channel. The marker is prepended so it takes
+  precedence over the one asyncio auto mode attaches to every coroutine test.
+  This hook sees every item in the session, so the loop scope is limited to
+  tests under this directory; unit tests collected alongside keep their own
+  per-function loops.
+  """
+  e2e_dir = Path(__file__).parent
   for item in items:
     if not item.get_closest_marker("timeout"):
       item.add_marker(pytest.mark.timeout(120))
+    if is_async_test(item) and item.path.is_relative_to(e2e_dir):
+      item.add_marker(pytest.mark.asyncio(loop_scope="session"), append=False)
 
 
 @pytest.fixture(scope="session")
@@ -25,33 +40,51 @@ def docker_compose_file() -> Path:
 def _is_server_responsive(host: str, port: int) -> bool:
   """Check if the gRPC server is accepting connections."""
   try:
-    with socket.create_connection((host, port), timeout=1):
+    with socket.create_connection((host, port), timeout=0.25):
       return True
   except OSError:
     return False
 
 
+def _wait_until_responsive(host: str, port: int, timeout: float) -> None:
+  """Poll the server with exponential backoff until it accepts connections.
+
+  Probing starts at 50ms and backs off to 1s, so a fast boot is detected
+  almost immediately without hammering a slow one.
+  """
+  deadline = time.monotonic() + timeout
+  pause = 0.05
+  while not _is_server_responsive(host, port):
+    if time.monotonic() >= deadline:
+      msg = f"Timed out waiting for simulator server at {host}:{port}"
+      raise TimeoutError(msg)
+    time.sleep(pause)
+    pause = min(pause * 2, 1.0)
+
+
 @pytest.fixture(scope="session")
 def simulator_server(docker_services: Services) -> tuple[str, int]:
   """Wait for the simulator server to be responsive and return (host, port)."""
   host = "localhost"
   port = docker_services.port_for("backend", 50051)
 
-  docker_services.wait_until_responsive(
-    timeout=60.0,
-    pause=0.5,
-    check=lambda: _is_server_responsive(host, port),
-  )
+  _wait_until_responsive(host, port, timeout=60.0)
 
   return (host, port)
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def grpc_channel(
   simulator_server: tuple[str, int],
 ) -> AsyncGenerator[Channel]:
-  """Create and yield a connected gRPC channel, close on teardown."""
+  """Create a gRPC channel shared by all e2e tests, close on teardown."""
   host, port = simulator_server
   channel = Channel(host=host, port=port)
   yield channel
   channel.close()
+
+
+@pytest.fixture(scope="session")
+def stub(grpc_channel: Channel) -> SimulatorServiceStub:
+  """Provide a SimulatorService stub on the shared gRPC channel."""
+  return SimulatorServiceStub(grpc_channel)
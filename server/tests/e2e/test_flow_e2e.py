@@ -15,7 +15,6 @@ from adk_sim_protos.google.ai.generativelanguage.v1beta import (
   GenerateContentRequest,
   GenerateContentResponse,
 )
-from grpclib.client import Channel
 from hamcrest import (
   assert_that,
   greater_than,
@@ -32,14 +31,12 @@ if TYPE_CHECKING:
 
 
 @pytest.mark.e2e
-async def test_submit_request_e2e(grpc_channel: Channel) -> None:
+async def test_submit_request_e2e(stub: SimulatorServiceStub) -> None:
   """Verify request submission returns an event ID.
 
   T047: Create session, submit request with turn_id,
   verify response contains event_id.
   """
-  stub = SimulatorServiceStub(grpc_channel)
-
   # Create a session first
   session_response = await stub.create_session(
     CreateSessionRequest(description="E2E submit_request test")
@@ -64,14 +61,12 @@ async def test_submit_request_e2e(grpc_channel: Channel) -> None:
 
 
 @pytest.mark.e2e
-async def test_submit_decision_e2e(grpc_channel: Channel) -> None:
+async def test_submit_decision_e2e(stub: SimulatorServiceStub) -> None:
   """Verify decision resolves pending request.
 
   T048: Create session, submit request, submit decision,
   verify the decision is acknowledged with event_id.
   """
-  stub = SimulatorServiceStub(grpc_channel)
-
   # Create a session
   session_response = await stub.create_session(
     CreateSessionRequest(description="E2E submit_decision test")
@@ -104,14 +99,12 @@ async def test_submit_decision_e2e(grpc_channel: Channel) -> None:
 
 
 @pytest.mark.e2e
-async def test_subscribe_receives_events_e2e(grpc_channel: Channel) -> None:
+async def test_subscribe_receives_events_e2e(stub: SimulatorServiceStub) -> None:
   """Verify streaming events via Subscribe.
 
   T049: Create session, start subscribe stream, submit a request,
   verify the subscribe stream receives the request event.
   """
-  stub = SimulatorServiceStub(grpc_channel)
-
   # Create a session
   session_response = await stub.create_session(
     CreateSessionRequest(description="E2E subscribe test")
@@ -157,7 +150,7 @@ async def test_subscribe_receives_events_e2e(grpc_channel: Channel) -> None:
 
 
 @pytest.mark.e2e
-async def test_full_round_trip_e2e(grpc_channel: Channel) -> None:
+async def test_full_round_trip_e2e(stub: SimulatorServiceStub) -> None:
   """Verify complete request→decision→event flow.
 
   T050: Create session, start subscribe stream in background,
@@ -165,8 +158,6 @@ async def test_full_round_trip_e2e(grpc_channel: Channel) -> None:
   submit decision → wait for decision event,
   verify full flow completes.
   """
-  stub = SimulatorServiceStub(grpc_channel)
-
   # Create a session
   session_response = await stub.create_session(
     CreateSessionRequest(description="E2E full round trip test")
@@ -238,7 +229,7 @@ async def test_full_round_trip_e2e(grpc_channel: Channel) -> None:
 
 
 @pytest.mark.e2e
-async def test_fifo_ordering_e2e(grpc_channel: Channel) -> None:
+async def test_fifo_ordering_e2e(stub: SimulatorServiceStub) -> None:
   """Verify parallel requests are queued in FIFO order.
 
   T051: Create session, submit 3 requests rapidly,
@@ -246,8 +237,6 @@ async def test_fifo_ordering_e2e(grpc_channel: Channel) -> None:
   The first request that gets its decision processed
   should be the first one submitted.
   """
-  stub = SimulatorServiceStub(grpc_channel)
-
   # Create a session
   session_response = await stub.create_session(
     CreateSessionRequest(description="E2E FIFO ordering test")
@@ -301,8 +290,6 @@ async def test_fifo_ordering_e2e(grpc_channel: Channel) -> None:
       )
     )
     decision_event_ids.append(response.event_id)
-    # Small delay to ensure ordering
-    await asyncio.sleep(0.05)
 
   # Wait for subscriber to receive all events
   await asyncio.wait_for(subscriber_task, timeout=5.0)
@@ -310,14 +297,10 @@ async def test_fifo_ordering_e2e(grpc_channel: Channel) -> None:
   # Verify we received all 6 events (3 requests + 3 decisions)
   assert_that(len(received_events), is_(6))
 
-  # First 3 should be requests in order
-  for i in range(3):
-    assert_that(received_events[i].turn_id, is_(turn_ids[i]))
-    assert_that(received_events[i].event_id, is_(request_event_ids[i]))
-
-  # Last 3 should be decisions in order
-  for i in range(3):
-    assert_that(received_events[i + 3].turn_id, is_(turn_ids[i]))
-    assert_that(received_events[i + 3].event_id, is_(decision_event_ids[i]))
-    # Decision events don't have an agent_name (they come from UI, not an agent)
-    assert_that(received_events[i + 3].agent_name, is_(""))
+  # First 3 should be requests in order, last 3 decisions in order
+  received = [(e.turn_id, e.event_id) for e in received_events]
+  assert_that(received[:3], is_(list(zip(turn_ids, request_event_ids, strict=True))))
+  assert_that(received[3:], is_(list(zip(turn_ids, decision_event_ids, strict=True))))
+
+  # Decision events don't have an agent_name (they come from UI, not an agent)
+  assert_that([e.agent_name for e in received_events[3:]], is_(["", "", ""]))
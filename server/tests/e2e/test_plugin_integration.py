@@ -25,7 +25,6 @@ from google.adk.agents import LlmAgent
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
 from google.genai import types
-from grpclib.client import Channel
 from hamcrest import assert_that, contains_string
 
 logger = logging.getLogger(__name__)
@@ -33,7 +32,7 @@ logger = logging.getLogger(__name__)
 
 @pytest.mark.e2e
 async def test_agent_interception_flow(
-  grpc_channel: Channel,
+  stub: SimulatorServiceStub,
   simulator_server: tuple[str, int],
 ) -> None:
   """Test full ADK Agent → Plugin → Server → Human → Agent loop.
@@ -79,7 +78,6 @@ async def test_agent_interception_flow(
   assert session_id is not None, "Plugin should have created a session"
 
   # Step B: Setup SimulatedHuman attached to plugin's session
-  stub = SimulatorServiceStub(grpc_channel)
   human = SimulatedHuman(stub, session_id, responses=configured_responses)
   human_task = asyncio.create_task(human.run_background_loop())
 
@@ -1,12 +1,13 @@
 """E2E tests for session management RPCs."""
 
+import asyncio
+
 import pytest
 from adk_sim_protos.adksim.v1 import (
   CreateSessionRequest,
   ListSessionsRequest,
   SimulatorServiceStub,
 )
-from grpclib.client import Channel
 from hamcrest import (
   assert_that,
   greater_than,
@@ -18,10 +19,8 @@ from hamcrest import (
 
 
 @pytest.mark.e2e
-async def test_create_session_e2e(grpc_channel: Channel) -> None:
+async def test_create_session_e2e(stub: SimulatorServiceStub) -> None:
   """Verify session creation via gRPC returns valid session."""
-  stub = SimulatorServiceStub(grpc_channel)
-
   # Create a session with a description
   description = "E2E test session for create"
   response = await stub.create_session(CreateSessionRequest(description=description))
@@ -35,21 +34,20 @@ async def test_create_session_e2e(grpc_channel: Channel) -> None:
 
 
 @pytest.mark.e2e
-async def test_list_sessions_e2e(grpc_channel: Channel) -> None:
+async def test_list_sessions_e2e(stub: SimulatorServiceStub) -> None:
   """Verify created sessions appear in list_sessions response."""
-  stub = SimulatorServiceStub(grpc_channel)
-
   # Create 3 sessions with unique descriptions
   descriptions = [
     "E2E list test session 1",
     "E2E list test session 2",
     "E2E list test session 3",
   ]
-  created_ids: list[str] = []
 
-  for desc in descriptions:
-    response = await stub.create_session(CreateSessionRequest(description=desc))
-    created_ids.append(response.session.id)
+  # The sessions are independent, so create them concurrently over the channel
+  responses = await asyncio.gather(
+    *(stub.create_session(CreateSessionRequest(description=d)) for d in descriptions)
+  )
+  created_ids = [response.session.id for response in responses]
 
   # Call list_sessions
   list_response = await stub.list_sessions(ListSessionsRequest(page_size=100))
@@ -5,14 +5,11 @@ from adk_sim_protos.adksim.v1 import (
   CreateSessionRequest,
   SimulatorServiceStub,
 )
-from grpclib.client import Channel
 
 
 @pytest.mark.e2e
-async def test_server_is_reachable(grpc_channel: Channel) -> None:
+async def test_server_is_reachable(stub: SimulatorServiceStub) -> None:
   """Verify the server accepts gRPC connections and responds to requests."""
-  stub = SimulatorServiceStub(grpc_channel)
-
   # Create a session to verify full round-trip communication
   response = await stub.create_session(
     CreateSessionRequest(description="E2E smoke test session")
@@ -22,7 +22,6 @@ from google.adk.agents import LlmAgent
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
 from google.genai import types
-from grpclib.client import Channel
 from hamcrest import assert_that, contains_string
 
 logger = logging.getLogger(__name__)
@@ -43,7 +42,7 @@ def add(a: int, b: int) -> int:
 
 @pytest.mark.e2e
 async def test_human_directed_tool_execution(
-  grpc_channel: Channel,
+  stub: SimulatorServiceStub,
   simulator_server: tuple[str, int],
 ) -> None:
   """Test #1: Verify Human can drive tool execution and see results.
@@ -79,7 +78,6 @@ async def test_human_directed_tool_execution(
   assert session_id is not None, "Plugin should have created a session"
 
   # Step B: Setup SimulatedHuman attached to plugin's session
-  stub = SimulatorServiceStub(grpc_channel)
   human = SimulatedHuman(stub, session_id, responses=configured_responses)
   human_task = asyncio.create_task(human.run_background_loop())
 
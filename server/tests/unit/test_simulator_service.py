@@ -359,6 +359,45 @@ class TestSimulatorService:
     assert _is_history_complete(events[2])
     assert events[2].history_complete.event_count == 2
 
+  @pytest.mark.asyncio
+  async def test_subscribe_resumes_after_last_event_id(
+    self, simulator_service: SimulatorServiceFixture
+  ) -> None:
+    """Test that subscribe skips history up to and including last_event_id."""
+    session = await simulator_service.manager.create_session("test session")
+
+    for turn_id in ("turn_1", "turn_2"):
+      await simulator_service.service.submit_request(
+        SubmitRequestRequest(
+          session_id=session.id,
+          turn_id=turn_id,
+          agent_name="agent",
+          request=GenerateContentRequest(),
+        )
+      )
+    history = await simulator_service.event_repo.get_by_session(session.id)
+
+    # Subscribe as a client that already received the first event
+    events: list[SessionEvent] = []
+    subscribe_request = SubscribeRequest(
+      session_id=session.id, last_event_id=history[0].event_id
+    )
+
+    async def collect_events() -> None:
+      async for response in simulator_service.service.subscribe(subscribe_request):
+        events.append(response.event)
+        # 1 remaining historical + 1 history_complete = 2 total
+        if len(events) >= 2:
+          break
+
+    await asyncio.wait_for(collect_events(), timeout=1.0)
+
+    # Verify replay resumed after the first event
+    assert len(events) == 2
+    assert events[0].turn_id == "turn_2"
+    assert _is_history_complete(events[1])
+    assert events[1].history_complete.event_count == 1
+
   @pytest.mark.asyncio
   async def test_subscribe_yields_live_events(
     self, simulator_service: SimulatorServiceFixture
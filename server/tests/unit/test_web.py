@@ -0,0 +1,232 @@
+"""Tests for the gRPC-Web gateway."""
+
+import os
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+import httpx
+import pybase64
+import pytest
+from adk_sim_protos.adksim.v1 import CreateSessionRequest
+from adk_sim_server import web
+from adk_sim_server.web import (
+  _decode_grpc_web_payload,
+  _encode_grpc_web_response,
+  _is_text_response,
+  create_app,
+)
+from adk_sim_testing.fixtures import FakeSimulatorService
+from grpclib.const import Status
+from grpclib.exceptions import GRPCError
+from starlette.applications import Starlette
+from starlette.requests import Request
+
+if TYPE_CHECKING:
+  from adk_sim_server.services.simulator_service import SimulatorService
+
+
+def _make_request(accept: str | None) -> Request:
+  """Create a Starlette request with an optional Accept header."""
+  headers = [] if accept is None else [(b"accept", accept.encode())]
+  return Request({"type": "http", "headers": headers})
+
+
+def _make_app(error: Exception | None = None) -> Starlette:
+  """Create the gateway app around a FakeSimulatorService."""
+  return create_app(cast("SimulatorService", FakeSimulatorService(error)))
+
+
+async def _post_create_session(
+  app: Starlette, body: bytes | AsyncIterator[bytes]
+) -> bytes:
+  """Send a binary gRPC-Web CreateSession request and return the body."""
+  transport = httpx.ASGITransport(app=app)
+  async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+    response = await client.post(
+      "/adksim.v1.SimulatorService/CreateSession",
+      content=body,
+      headers={"content-type": "application/grpc-web+proto"},
+    )
+  return response.content
+
+
+async def _get(
+  app: Starlette, path: str, headers: dict[str, str] | None = None
+) -> httpx.Response:
+  """Send a GET request to the app and return the response."""
+  transport = httpx.ASGITransport(app=app)
+  async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+    return await client.get(path, headers=headers)
+
+
+@pytest.fixture
+def static_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+  """Point the bundled frontend directory at an empty temporary one."""
+  monkeypatch.setattr(web, "STATIC_DIR", tmp_path)
+  return tmp_path
+
+
+class TestDecodeGrpcWebPayload:
+  """Test suite for _decode_grpc_web_payload."""
+
+  @pytest.mark.parametrize("is_text", [False, True])
+  def test_round_trips_encoded_message(self, is_text: bool) -> None:
+    """Test that a framed message decodes back to the original message."""
+    message = CreateSessionRequest(description="hello")
+    body = _encode_grpc_web_response(message, is_text)
+
+    payload = _decode_grpc_web_payload(body, is_text)
+
+    assert type(payload) is bytes
+    assert CreateSessionRequest().parse(payload) == message
+
+  def test_rejects_body_shorter_than_header(self) -> None:
+    """Test that a body without a complete frame header is rejected."""
+    with pytest.raises(ValueError, match="too short"):
+      _decode_grpc_web_payload(b"\x00\x00\x00", is_text=False)
+
+  @pytest.mark.parametrize("is_text", [False, True])
+  def test_rejects_truncated_message(self, is_text: bool) -> None:
+    """Test that a frame declaring more bytes than were sent is rejected."""
+    body = b"\x00\x00\x00\x00\x10" + b"short"
+    if is_text:
+      body = pybase64.b64encode(body)
+
+    with pytest.raises(ValueError, match="declares 16 message bytes"):
+      _decode_grpc_web_payload(body, is_text)
+
+
+class TestIsTextResponse:
+  """Test suite for _is_text_response."""
+
+  def test_binary_request_gets_binary_response(self) -> None:
+    """Test that binary requests are never answered with text."""
+    request = _make_request("application/grpc-web-text")
+
+    assert not _is_text_response(request, is_text=False)
+
+  @pytest.mark.parametrize(
+    "accept",
+    [None, "application/grpc-web-text", "*/*"],
+    ids=["no_accept", "text_only", "wildcard"],
+  )
+  def test_text_request_gets_text_response(self, accept: str | None) -> None:
+    """Test that text requests stay text unless binary is explicitly accepted."""
+    assert _is_text_response(_make_request(accept), is_text=True)
+
+  @pytest.mark.parametrize(
+    "accept",
+    [
+      "application/grpc-web+proto",
+      "application/grpc-web-text, application/grpc-web;q=0.5",
+    ],
+    ids=["proto", "grpc_web_with_params"],
+  )
+  def test_text_request_accepting_binary_gets_binary(self, accept: str) -> None:
+    """Test that a text request listing a binary type gets a binary response."""
+    assert not _is_text_response(_make_request(accept), is_text=True)
+
+
+class TestGrpcWebHandlerErrors:
+  """Test suite for grpc_web_handler error reporting."""
+
+  async def test_malformed_payload_reports_invalid_argument(self) -> None:
+    """Test that a truncated frame is reported as INVALID_ARGUMENT."""
+    app = _make_app()
+
+    body = await _post_create_session(app, b"\x00\x00")
+
+    assert b"grpc-status:3\r\n" in body
+
+  async def test_truncated_protobuf_reports_invalid_argument(self) -> None:
+    """Test that a complete frame holding a cut-off protobuf is INVALID_ARGUMENT."""
+    app = _make_app()
+
+    body = await _post_create_session(app, b"\x00\x00\x00\x00\x01\x0a")
+
+    assert b"grpc-status:3\r\n" in body
+
+  async def test_body_read_error_reports_unknown(self) -> None:
+    """Test that a failure while reading the body still gets an error trailer."""
+
+    async def failing_body() -> AsyncIterator[bytes]:
+      yield b"\x00\x00"
+      raise OSError("connection reset")
+
+    app = _make_app()
+
+    body = await _post_create_session(app, failing_body())
+
+    assert b"grpc-status:2\r\ngrpc-message:connection reset\r\n" in body
+
+  async def test_service_grpc_error_status_is_forwarded(self) -> None:
+    """Test that a GRPCError raised by the service keeps its status."""
+    error = GRPCError(Status.NOT_FOUND, "no such session")
+    app = _make_app(error)
+    request_body = _encode_grpc_web_response(CreateSessionRequest(), False)
+
+    body = await _post_create_session(app, request_body)
+
+    assert b"grpc-status:5\r\ngrpc-message:no such session\r\n" in body
+
+  async def test_unexpected_service_error_reports_unknown(self) -> None:
+    """Test that any other service exception is reported as UNKNOWN."""
+    app = _make_app(RuntimeError("boom"))
+    request_body = _encode_grpc_web_response(CreateSessionRequest(), False)
+
+    body = await _post_create_session(app, request_body)
+
+    assert b"grpc-status:2\r\ngrpc-message:boom\r\n" in body
+
+
+class TestSpaHandler:
+  """Test suite for serving the bundled frontend's index.html."""
+
+  async def test_client_route_serves_index_with_etag(self, static_dir: Path) -> None:
+    """Test that an unknown path gets index.html, revalidated by ETag."""
+    (static_dir / "index.html").write_bytes(b"<html>v1</html>")
+
+    response = await _get(_make_app(), "/session/123")
+
+    assert response.status_code == 200
+    assert response.content == b"<html>v1</html>"
+    assert response.headers["cache-control"] == "no-cache"
+    assert response.headers["etag"].startswith('"')
+
+  async def test_matching_if_none_match_returns_not_modified(
+    self, static_dir: Path
+  ) -> None:
+    """Test that a request carrying the current ETag gets an empty 304."""
+    (static_dir / "index.html").write_bytes(b"<html>v1</html>")
+    app = _make_app()
+    etag = (await _get(app, "/session/123")).headers["etag"]
+
+    response = await _get(app, "/session/456", headers={"if-none-match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+  async def test_rebuilt_index_is_served_without_restart(
+    self, static_dir: Path
+  ) -> None:
+    """Test that a changed index.html replaces the in-memory copy."""
+    index_path = static_dir / "index.html"
+    index_path.write_bytes(b"<html>v1</html>")
+    app = _make_app()
+    first = await _get(app, "/")
+
+    index_path.write_bytes(b"<html>version 2</html>")
+    os.utime(index_path, ns=(0, index_path.stat().st_mtime_ns + 1_000_000))
+    second = await _get(app, "/", headers={"if-none-match": first.headers["etag"]})
+
+    assert second.status_code == 200
+    assert second.content == b"<html>version 2</html>"
+    assert second.headers["etag"] != first.headers["etag"]
+
+  async def test_missing_index_returns_not_found(self, static_dir: Path) -> None:
+    """Test that a server without a bundled frontend answers 404."""
+    response = await _get(_make_app(), "/session/123")
+
+    assert response.status_code == 404